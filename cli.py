@@ -5,47 +5,76 @@ Provides a modern CLI with multiple commands and options.
 
 import json
 import os
-import glob
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
+
+PROG_NAME = "Web Scraper Tool"
+VERSION = "2.1.0"
+
+# `--version` needs nothing but these constants, so answer it before
+# importing click, PyYAML or the config loader
+if __name__ == '__main__' and sys.argv[1:] == ['--version']:
+    print(f"{PROG_NAME}, version {VERSION}")
+    sys.exit(0)
 
 import click
-from colorama import init, Fore, Style
 
-from config_loader import ConfigLoader, ScraperConfig
-from universal_scraper import UniversalScraper, ComprehensiveScraper
-import pdf_processor
+from config_loader import DEFAULT_MAX_WORKERS, ConfigLoader, ScraperConfig, ScrapingTarget
+
+# Optional: orjson serializes large outputs much faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Scraper and PDF modules pull in requests/bs4/pdfplumber, so they are
+# imported inside the commands that need them to keep startup fast.
+
+# Only Windows consoles need colorama to translate ANSI escape codes;
+# elsewhere its stream wrapper is pure overhead
+if sys.platform == 'win32':
+    from colorama import init
+    init(autoreset=True)
 
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+# Resolve colour codes once; drop them entirely when output is piped or redirected
+if sys.stdout.isatty():
+    _GREEN, _YELLOW, _RED, _BLUE = '\033[32m', '\033[33m', '\033[31m', '\033[34m'
+    _RESET = '\033[0m'
+else:
+    _GREEN = _YELLOW = _RED = _BLUE = _RESET = ""
 
 # Default configuration file
 DEFAULT_CONFIG = "config.yml"
 
+# How many validation errors `scrape` reports before giving up
+MAX_REPORTED_ERRORS = 20
+
 
 def print_success(message: str):
     """Print a success message in green."""
-    click.echo(f"{Fore.GREEN}✅ {message}{Style.RESET_ALL}")
+    click.echo(f"{_GREEN}✅ {message}{_RESET}")
 
 
 def print_warning(message: str):
     """Print a warning message in yellow."""
-    click.echo(f"{Fore.YELLOW}⚠️  {message}{Style.RESET_ALL}")
+    click.echo(f"{_YELLOW}⚠️  {message}{_RESET}")
 
 
 def print_error(message: str):
     """Print an error message in red."""
-    click.echo(f"{Fore.RED}❌ {message}{Style.RESET_ALL}")
+    click.echo(f"{_RED}❌ {message}{_RESET}")
 
 
 def print_info(message: str):
     """Print an info message in blue."""
-    click.echo(f"{Fore.BLUE}ℹ️  {message}{Style.RESET_ALL}")
+    click.echo(f"{_BLUE}ℹ️  {message}{_RESET}")
 
 
 @click.group()
-@click.version_option(version="2.1.0", prog_name="Web Scraper Tool")
+@click.version_option(version=VERSION, prog_name=PROG_NAME)
 def cli():
     """
     🚀 Configuration-Driven Web Scraper Tool
@@ -82,7 +111,18 @@ def cli():
     is_flag=True, 
     help='Show what would be scraped without actually doing it'
 )
-def scrape(config: str, output: Optional[str], target: Optional[str], skip_pdf: bool, dry_run: bool):
+@click.option(
+    '--max-workers', '-w',
+    type=click.IntRange(min=1),
+    help='Concurrent requests per target (overrides config)'
+)
+@click.option(
+    '--quiet', '-q',
+    is_flag=True,
+    help='Only print summaries, warnings and errors, not a line per page'
+)
+def scrape(config: str, output: Optional[str], target: Optional[str], skip_pdf: bool, dry_run: bool,
+           max_workers: Optional[int], quiet: bool):
     """
     🎯 Scrape content from configured websites and process PDFs.
     
@@ -93,14 +133,16 @@ def scrape(config: str, output: Optional[str], target: Optional[str], skip_pdf:
         python cli.py scrape --config my-config.yml
         python cli.py scrape --target "Interviewing.io Blog"
         python cli.py scrape --skip-pdf --dry-run
+        python cli.py scrape --max-workers 16
+        python cli.py scrape --quiet
     """
     try:
         # Load configuration
         print_info(f"Loading configuration from: {config}")
         scraper_config = ConfigLoader.load_config(config)
         
-        # Validate configuration
-        errors = ConfigLoader.validate_config(scraper_config)
+        # Validate configuration (only the first few errors are needed to bail out)
+        errors = list(islice(ConfigLoader.validate_config(scraper_config), MAX_REPORTED_ERRORS))
         if errors:
             print_error("Configuration validation failed:")
             for error in errors:
@@ -111,6 +153,9 @@ def scrape(config: str, output: Optional[str], target: Optional[str], skip_pdf:
         if output:
             scraper_config.output_file = output
         
+        if max_workers:
+            scraper_config.max_workers = max_workers
+        
         # Get targets to scrape
         if target:
             # Scrape specific target
@@ -145,43 +190,55 @@ def scrape(config: str, output: Optional[str], target: Optional[str], skip_pdf:
         if scraper_config.zenrows_config.get('enabled', False):
             zenrows_api_key = scraper_config.zenrows_config.get('api_key')
         
-        universal_scraper = UniversalScraper(zenrows_api_key=zenrows_api_key)
+        from http_session import create_session
+        from universal_scraper import UniversalScraper
         
-        for target_config in targets:
-            print_info(f"Scraping {target_config.name}...")
+        # One session for every target, so hosts shared between targets reuse connections
+        with create_session(max_workers=scraper_config.max_workers or DEFAULT_MAX_WORKERS) as session:
+            universal_scraper = UniversalScraper(zenrows_api_key=zenrows_api_key, session=session,
+                                                 request_delay=scraper_config.request_delay,
+                                                 verbose=not quiet,
+                                                 async_fetch=scraper_config.async_fetch)
             
-            if target_config.type in ['blog', 'newsletter', 'guides', 'topics', 'learn']:
-                # Discover articles first, then scrape them
-                try:
-                    article_urls = universal_scraper.discover_article_urls(target_config.url, max_urls=20)
-                    print_info(f"Found {len(article_urls)} articles to scrape from {target_config.name}")
+            # Targets are independent sites, so scrape them concurrently. The worker
+            # budget is shared: each target's article pool gets its slice of it
+            target_workers = scraper_config.worker_count(len(targets))
+            article_workers = max(1, (scraper_config.max_workers or DEFAULT_MAX_WORKERS) // target_workers)
+            # Indexed by position, since target names aren't guaranteed to be unique
+            results_by_target = [[] for _ in targets]
+            with ThreadPoolExecutor(max_workers=target_workers) as executor:
+                future_to_index = {
+                    executor.submit(scrape_target, universal_scraper, target_config, scraper_config,
+                                    article_workers): index
+                    for index, target_config in enumerate(targets)
+                }
+                
+                for future in as_completed(future_to_index):
+                    index = future_to_index[future]
+                    target_config = targets[index]
+                    try:
+                        items = future.result()
+                    except Exception as e:
+                        print_warning(f"Error scraping {target_config.name}: {e}")
+                        items = []
                     
-                    if article_urls:
-                        items = universal_scraper.scrape_multiple_urls(article_urls, max_workers=scraper_config.max_workers)
-                    else:
-                        # Try scraping the main page directly
-                        item = universal_scraper.scrape_url(target_config.url) 
-                        items = [item] if item else []
-                        
-                except Exception as e:
-                    print_warning(f"Error scraping {target_config.name}: {e}")
-                    items = []
-            else:
-                # For other types, try scraping directly
-                item = universal_scraper.scrape_url(target_config.url)
-                items = [item] if item else []
-            
-            # Add team_id and user_id to items
-            for item in items:
-                if item:
-                    item['user_id'] = scraper_config.team_id
-            
+                    results_by_target[index] = items
+                    print_info(f"Scraped {len(items)} items from {target_config.name}")
+        
+        # Keep the output in configuration order regardless of completion order
+        for items in results_by_target:
             all_items.extend(items)
-            print_info(f"Scraped {len(items)} items from {target_config.name}")
+        
+        # Targets can reach the same article through different URLs
+        from content_dedupe import dedupe_items
+        scraped_count = len(all_items)
+        all_items = dedupe_items(all_items)
+        if len(all_items) < scraped_count:
+            print_info(f"Dropped {scraped_count - len(all_items)} duplicate articles")
         
         # Process PDFs if enabled
         if not skip_pdf and scraper_config.pdf_processing.get('enabled', True):
-            pdf_items = process_pdfs(scraper_config)
+            pdf_items = process_pdfs(scraper_config, verbose=not quiet)
             all_items.extend(pdf_items)
         
         # Save results
@@ -222,8 +279,10 @@ def process_pdf(pdf_path: str, output: Optional[str], config: str):
         # Load configuration for PDF processing settings
         scraper_config = ConfigLoader.load_config(config) if os.path.exists(config) else ScraperConfig()
         
+        import pdf_processor
+        
         print_info(f"Processing PDF: {pdf_path} (first 8 chapters only)")
-        items = pdf_processor.process_book_chapters(pdf_path, max_chapters=8)
+        items = pdf_processor.process_book_chapters_cached(pdf_path, max_chapters=8)
         
         if not items:
             print_warning("No content extracted from PDF")
@@ -231,14 +290,9 @@ def process_pdf(pdf_path: str, output: Optional[str], config: str):
         
         # Prepare output
         output_file = output or "pdf_output.json"
-        final_output = {
-            "team_id": scraper_config.team_id,
-            "items": items
-        }
         
         # Save results
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(final_output, f, indent=2, ensure_ascii=False)
+        write_output_json(output_file, scraper_config.team_id, items)
         
         print_success(f"PDF processed! {len(items)} items saved to {output_file}")
         
@@ -298,7 +352,6 @@ def scrape_url(url: str, title_selector: str, content_selector: str, output: Opt
         print_info(f"Scraping URL: {url}")
         
         # Create a temporary target configuration
-        from config_loader import ScrapingTarget
         temp_target = ScrapingTarget(
             name="Single URL",
             url=url,
@@ -315,8 +368,10 @@ def scrape_url(url: str, title_selector: str, content_selector: str, output: Opt
             zenrows_api_key = scraper_config.zenrows_config.get('api_key')
         
         # Use UniversalScraper for consistent behavior
+        from universal_scraper import UniversalScraper
         universal_scraper = UniversalScraper(zenrows_api_key=zenrows_api_key)
-        result = universal_scraper.scrape_url(url)
+        with universal_scraper.session:
+            result = universal_scraper.scrape_url(url)
         
         # Add team_id if result found
         if result:
@@ -328,14 +383,9 @@ def scrape_url(url: str, title_selector: str, content_selector: str, output: Opt
         
         # Prepare output
         output_file = output or "single_page_output.json"
-        final_output = {
-            "team_id": scraper_config.team_id,
-            "items": [result]
-        }
         
         # Save results
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(final_output, f, indent=2, ensure_ascii=False)
+        write_output_json(output_file, scraper_config.team_id, [result])
         
         scraper_method = result.get('scraped_with', 'regular')
         print_success(f"URL scraped with {scraper_method}! Content saved to {output_file}")
@@ -366,7 +416,7 @@ def validate(config: str):
         scraper_config = ConfigLoader.load_config(config)
         
         # Validate configuration
-        errors = ConfigLoader.validate_config(scraper_config)
+        errors = list(ConfigLoader.validate_config(scraper_config))
         if errors:
             print_error("Configuration validation failed:")
             for error in errors:
@@ -377,27 +427,32 @@ def validate(config: str):
         
         # Show configuration summary
         print_info("Configuration Summary:")
-        click.echo(f"  • Team ID: {scraper_config.team_id}")
-        click.echo(f"  • Output File: {scraper_config.output_file}")
-        click.echo(f"  • PDF Directory: {scraper_config.pdf_directory}")
-        click.echo(f"  • Max Workers: {scraper_config.max_workers}")
-        click.echo(f"  • Request Delay: {scraper_config.request_delay}s")
+        lines = [
+            f"  • Team ID: {scraper_config.team_id}",
+            f"  • Output File: {scraper_config.output_file}",
+            f"  • PDF Directory: {scraper_config.pdf_directory}",
+            f"  • Max Workers: {scraper_config.max_workers or f'auto ({DEFAULT_MAX_WORKERS})'}",
+            f"  • Request Delay: {scraper_config.request_delay}s",
+        ]
         
         # Show targets
         enabled_targets = ConfigLoader.get_enabled_targets(scraper_config)
-        disabled_targets = [t for t in scraper_config.targets if not t.enabled]
+        disabled_targets = ConfigLoader.get_disabled_targets(scraper_config)
         
-        click.echo(f"\n  📋 Targets ({len(scraper_config.targets)} total):")
+        lines.append(f"\n  📋 Targets ({len(scraper_config.targets)} total):")
         for target in enabled_targets:
-            click.echo(f"    ✅ {target.name} ({target.type}) - {target.url}")
+            lines.append(f"    ✅ {target.name} ({target.type}) - {target.url}")
         
         for target in disabled_targets:
-            click.echo(f"    ❌ {target.name} ({target.type}) - DISABLED")
+            lines.append(f"    ❌ {target.name} ({target.type}) - DISABLED")
         
         if scraper_config.pdf_processing.get('enabled', True):
-            click.echo(f"\n  📄 PDF Processing: Enabled (directory: {scraper_config.pdf_directory})")
+            lines.append(f"\n  📄 PDF Processing: Enabled (directory: {scraper_config.pdf_directory})")
         else:
-            click.echo(f"\n  📄 PDF Processing: Disabled")
+            lines.append(f"\n  📄 PDF Processing: Disabled")
+        
+        # Emit the whole summary in one write
+        click.echo("\n".join(lines))
         
     except Exception as e:
         print_error(f"Configuration validation failed: {e}")
@@ -429,17 +484,21 @@ def list_targets(config: str):
         
         print_info(f"Scraping Targets ({len(scraper_config.targets)} total):")
         
+        # Buffer every line and emit them in one write
+        lines = []
         for i, target in enumerate(scraper_config.targets, 1):
-            status = f"{Fore.GREEN}✅ Enabled" if target.enabled else f"{Fore.RED}❌ Disabled"
-            click.echo(f"{i:2d}. {target.name}")
-            click.echo(f"     Type: {target.type}")
-            click.echo(f"     URL: {target.url}")
-            click.echo(f"     Status: {status}{Style.RESET_ALL}")
+            status = f"{_GREEN}✅ Enabled" if target.enabled else f"{_RED}❌ Disabled"
+            lines.append(f"{i:2d}. {target.name}")
+            lines.append(f"     Type: {target.type}")
+            lines.append(f"     URL: {target.url}")
+            lines.append(f"     Status: {status}{_RESET}")
             if target.article_link_selector:
-                click.echo(f"     Link Selector: {target.article_link_selector}")
+                lines.append(f"     Link Selector: {target.article_link_selector}")
             if target.content_selectors:
-                click.echo(f"     Content Selectors: {', '.join(target.content_selectors[:2])}{'...' if len(target.content_selectors) > 2 else ''}")
-            click.echo()
+                lines.append(f"     Content Selectors: {', '.join(target.content_selectors[:2])}{'...' if len(target.content_selectors) > 2 else ''}")
+            lines.append("")
+        
+        click.echo("\n".join(lines))
             
     except Exception as e:
         print_error(f"Failed to list targets: {e}")
@@ -474,10 +533,12 @@ def comprehensive_scrape():
             zenrows_api_key = scraper_config.zenrows_config.get('api_key')
         
         # Use ComprehensiveScraper
+        from universal_scraper import ComprehensiveScraper
         comprehensive_scraper = ComprehensiveScraper(zenrows_api_key=zenrows_api_key)
         
-        # Run comprehensive scraping
-        all_items = comprehensive_scraper.scrape_all_sources()
+        # Run comprehensive scraping (every source shares the scraper's session)
+        with comprehensive_scraper.scraper.session:
+            all_items = comprehensive_scraper.scrape_all_sources()
         
         # Save results
         comprehensive_scraper.save_to_json('output.json')
@@ -514,7 +575,7 @@ def zenrows_status(config: str):
         
         # Show configuration status
         if zenrows_config.get('enabled', False):
-            click.echo(f"  Status: {Fore.GREEN}✅ Enabled{Style.RESET_ALL}")
+            click.echo(f"  Status: {_GREEN}✅ Enabled{_RESET}")
             
             api_key = zenrows_config.get('api_key', '')
             if api_key:
@@ -528,14 +589,14 @@ def zenrows_status(config: str):
                     status_info = zenrows.check_api_status()
                     
                     if status_info['status'] == 'active':
-                        click.echo(f"  API Status: {Fore.GREEN}✅ Active{Style.RESET_ALL}")
+                        click.echo(f"  API Status: {_GREEN}✅ Active{_RESET}")
                         click.echo(f"  Response Time: {status_info['response_time']:.2f}s")
                         if status_info['remaining_credits'] != 'Unknown':
                             click.echo(f"  Remaining Credits: {status_info['remaining_credits']}")
                         if status_info['credits_reset'] != 'Unknown':
                             click.echo(f"  Credits Reset: {status_info['credits_reset']}")
                     else:
-                        click.echo(f"  API Status: {Fore.RED}❌ Error{Style.RESET_ALL}")
+                        click.echo(f"  API Status: {_RED}❌ Error{_RESET}")
                         click.echo(f"  Error: {status_info['error']}")
                         
                 except ImportError:
@@ -545,7 +606,7 @@ def zenrows_status(config: str):
             else:
                 print_warning("API key not configured")
         else:
-            click.echo(f"  Status: {Fore.RED}❌ Disabled{Style.RESET_ALL}")
+            click.echo(f"  Status: {_RED}❌ Disabled{_RESET}")
         
         # Show fallback settings
         print_info("\nFallback Settings:")
@@ -555,10 +616,12 @@ def zenrows_status(config: str):
             ('Network Errors', 'fallback_for_network_errors'),
         ]
         
+        lines = []
         for name, key in fallback_settings:
             enabled = zenrows_config.get(key, False)
-            status = f"{Fore.GREEN}✅" if enabled else f"{Fore.RED}❌"
-            click.echo(f"  {name}: {status} {Style.RESET_ALL}")
+            status = f"{_GREEN}✅" if enabled else f"{_RED}❌"
+            lines.append(f"  {name}: {status} {_RESET}")
+        click.echo("\n".join(lines))
         
         # Show premium features
         print_info("\nPremium Features:")
@@ -568,47 +631,165 @@ def zenrows_status(config: str):
             ('Error Fallback', 'use_premium_for_errors'),
         ]
         
+        lines = []
         for name, key in premium_settings:
             enabled = zenrows_config.get(key, False)
-            status = f"{Fore.GREEN}✅" if enabled else f"{Fore.RED}❌"
-            click.echo(f"  {name}: {status} {Style.RESET_ALL}")
+            status = f"{_GREEN}✅" if enabled else f"{_RED}❌"
+            lines.append(f"  {name}: {status} {_RESET}")
+        click.echo("\n".join(lines))
             
     except Exception as e:
         print_error(f"Failed to check ZenRows status: {e}")
         sys.exit(1)
 
 
-def process_pdfs(config: ScraperConfig) -> List[dict]:
-    """Process all PDFs in the configured directory using multithreaded processing."""
-    pdf_files = glob.glob(os.path.join(config.pdf_directory, '*.pdf'))
+def scrape_target(universal_scraper, target_config: ScrapingTarget, config: ScraperConfig,
+                  max_workers: Optional[int] = None) -> List[dict]:
+    """
+    Scrape a single target and tag its items with the team's user_id.
+    
+    max_workers caps the target's article pool below the configured worker
+    count, for when several targets are scraped at once.
+    """
+    print_info(f"Scraping {target_config.name}...")
+    
+    if target_config.type in ['blog', 'newsletter', 'guides', 'topics', 'learn']:
+        # Discover articles first, then scrape them
+        try:
+            article_urls = universal_scraper.discover_article_urls(target_config.url, max_urls=20)
+            print_info(f"Found {len(article_urls)} articles to scrape from {target_config.name}")
+            
+            if article_urls:
+                workers = config.worker_count(len(article_urls))
+                if max_workers is not None:
+                    workers = min(workers, max_workers)
+                items = universal_scraper.scrape_multiple_urls(article_urls, max_workers=workers)
+            else:
+                # Try scraping the main page directly
+                item = universal_scraper.scrape_url(target_config.url) 
+                items = [item] if item else []
+                
+        except Exception as e:
+            print_warning(f"Error scraping {target_config.name}: {e}")
+            items = []
+    else:
+        # For other types, try scraping directly
+        item = universal_scraper.scrape_url(target_config.url)
+        items = [item] if item else []
+    
+    # Add team_id and user_id to items
+    items = [item for item in items if item]
+    for item in items:
+        item['user_id'] = config.team_id
+    
+    return items
+
+
+# pdf_processor module, set in each PDF worker process by _init_pdf_worker
+_pdf_processor = None
+
+
+def _init_pdf_worker():
+    """Import pdf_processor (and its PDF extractor) once when a worker process starts."""
+    global _pdf_processor
+    import pdf_processor
+    _pdf_processor = pdf_processor
+
+
+def _process_pdf_in_worker(pdf_path: str, page_workers: int, verbose: bool) -> List[dict]:
+    """Extract the first 8 chapters of one PDF inside a pool worker."""
+    return _pdf_processor.process_book_chapters_cached(pdf_path, max_chapters=8, page_workers=page_workers,
+                                                       verbose=verbose)
+
+
+def process_pdfs(config: ScraperConfig, verbose: bool = True) -> List[dict]:
+    """
+    Process all PDFs in the configured directory, one worker process per file.
+    
+    verbose=False drops the per-section lines; per-book summaries still print.
+    """
+    try:
+        with os.scandir(config.pdf_directory) as entries:
+            pdf_files = [
+                entry.path for entry in entries
+                if entry.name.lower().endswith('.pdf') and entry.is_file()
+            ]
+    except FileNotFoundError:
+        pdf_files = []
     
     if not pdf_files:
         print_warning(f"No PDFs found in '{config.pdf_directory}' directory")
         return []
     
-    print_info(f"Processing {len(pdf_files)} PDF(s) with multithreading (first 8 chapters each)")
+    print_info(f"Processing {len(pdf_files)} PDF(s) in parallel (first 8 chapters each)")
     
-    # Use the new multithreaded PDF processor with 8-chapter limit
-    all_items = pdf_processor.process_multiple_pdfs_threaded(
-        pdf_paths=pdf_files,
-        max_chapters=8,
-        max_workers=min(len(pdf_files), 4)  # Don't exceed 4 workers or number of files
-    )
+    # PDF extraction is CPU-bound, so use processes rather than threads to sidestep the GIL
+    cpu_count = os.cpu_count() or 1
+    max_workers = min(len(pdf_files), cpu_count)
+    # Each file's pages are split further across that file's share of the CPUs
+    page_workers = max(1, cpu_count // len(pdf_files))
+    # Collected per file so the output keeps directory order whatever finishes first
+    items_by_file = [[] for _ in pdf_files]
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_pdf_worker) as executor:
+        future_to_index = {
+            executor.submit(_process_pdf_in_worker, pdf_path, page_workers, verbose): i
+            for i, pdf_path in enumerate(pdf_files)
+        }
+        for future in as_completed(future_to_index):
+            index = future_to_index[future]
+            pdf_name = os.path.basename(pdf_files[index])
+            try:
+                items = future.result()
+            except Exception as e:
+                # A bad PDF or a dead worker only loses that file, not the whole run
+                print_error(f"Failed to process {pdf_name}: {e}")
+                continue
+            items_by_file[index] = items
+            print_info(f"Completed {pdf_name} ({len(items)} items)")
     
+    all_items = [item for items in items_by_file for item in items]
     print_success(f"PDF processing completed: {len(all_items)} total items extracted")
     return all_items
 
 
+def _encode_json(data) -> bytes:
+    """Serialize data as 2-space-indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_output_json(path: str, team_id: str, items: Iterable[dict]):
+    """
+    Write the {"team_id", "items"} output document atomically, encoding one item at a time.
+    
+    Only one item is ever held in serialized form, and the bytes are the same
+    as encoding the whole document at once.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            f.write(b'{\n  "team_id": ' + _encode_json(team_id) + b',\n  "items": [')
+            wrote_item = False
+            for item in items:
+                # Newlines inside JSON strings are escaped, so this only re-indents structure
+                f.write((b',\n    ' if wrote_item else b'\n    ') + _encode_json(item).replace(b'\n', b'\n    '))
+                wrote_item = True
+            f.write(b'\n  ]\n}' if wrote_item else b']\n}')
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Also covers unserialisable items (TypeError / JSONEncodeError) and Ctrl-C
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def save_results(items: List[dict], config: ScraperConfig):
     """Save scraping results to a JSON file."""
-    final_output = {
-        "team_id": config.team_id,
-        "items": items
-    }
-    
     try:
-        with open(config.output_file, 'w', encoding='utf-8') as f:
-            json.dump(final_output, f, indent=2, ensure_ascii=False)
+        write_output_json(config.output_file, config.team_id, items)
         print_success(f"Results saved to: {config.output_file}")
     except IOError as e:
         print_error(f"Failed to save results: {e}")
@@ -4,12 +4,85 @@ Handles loading and validating YAML configuration files.
 """
 
 import yaml
+import copy
+import json
 import os
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Optional
+from dataclasses import dataclass, field
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+# Optional: Aho-Corasick automaton matches every exclude pattern in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Suffix of the sidecar file holding the config's YAML data as JSON. JSON rather
+# than pickle, since loading a pickle someone planted beside config.yml runs code.
+CONFIG_CACHE_SUFFIX = ".cache.json"
+# Bump whenever the sidecar format changes so stale caches are ignored
+CONFIG_CACHE_VERSION = 10
+
+# Scraping is I/O-bound, so the worker default scales well past the CPU count;
+# per-host pacing is left to the rate limiter rather than a small pool
+DEFAULT_MAX_WORKERS = max(32, (os.cpu_count() or 1) * 5)
+
+# Defaults for the legacy 'targets' format. List fields default to None so
+# ScrapingTarget.__post_init__ gives every target its own fresh list.
+_TARGET_DEFAULTS = {
+    'name': '',
+    'url': '',
+    'type': 'blog',
+    'enabled': True,
+    'article_link_selector': '',
+    'article_link_filter': '',
+    'title_selector': 'h1',
+    'content_selectors': None,
+    'author_selector': '',
+    'author_extraction': '',
+    'default_author': '',
+    'content_elements': None,
+    'content_min_length': 50,
+    'exclude_content_patterns': None,
+    'discovery_pages': None,
+}
+
+# Target fields whose values repeat across targets ("blog", "h1", "", ...)
+_INTERNED_TARGET_FIELDS = ('type', 'title_selector', 'author_selector', 'author_extraction', 'default_author')
+
+
+def _slotted_dataclass(cls):
+    """
+    Apply @dataclass(slots=True), building the slotted class by hand before Python 3.10.
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+    cls = dataclass(cls)
+    # Slots can't coexist with class attributes of the same name. The generated
+    # __init__ carries the init field defaults; init=False fields must be set
+    # in __post_init__, as they are no longer backed by a class attribute.
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in cls.__dataclass_fields__ and key not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = tuple(cls.__dataclass_fields__)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings so identical values share one object across targets."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@_slotted_dataclass
 class ScrapingTarget:
     """Represents a single scraping target with its configuration."""
     name: str
@@ -27,32 +100,64 @@ class ScrapingTarget:
     content_min_length: int = 50
     exclude_content_patterns: List[str] = None
     discovery_pages: List[str] = None
+    # Exclude patterns compiled into one Aho-Corasick automaton, or into a regex
+    # alternation when pyahocorasick is missing; both match lowercased text
+    _exclude_automaton: Any = field(default=None, init=False, repr=False, compare=False)
+    _exclude_re: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        self._exclude_automaton = self._exclude_re = None
         if self.content_selectors is None:
             self.content_selectors = []
         if self.content_elements is None:
             self.content_elements = []
-        if self.exclude_content_patterns is None:
-            self.exclude_content_patterns = []
+        # Matching is case-insensitive, so lowercase the patterns once here
+        self.exclude_content_patterns = [pattern.lower() for pattern in self.exclude_content_patterns or []]
         if self.discovery_pages is None:
             self.discovery_pages = []
+        # The automaton drops empty keys, which must still match everything
+        if ahocorasick is not None and self.exclude_content_patterns and all(self.exclude_content_patterns):
+            self._exclude_automaton = ahocorasick.Automaton()
+            for pattern in self.exclude_content_patterns:
+                self._exclude_automaton.add_word(pattern, True)
+            self._exclude_automaton.make_automaton()
+        elif self.exclude_content_patterns:
+            # Patterns are plain substrings, so escape them before joining
+            self._exclude_re = re.compile(
+                '|'.join(re.escape(pattern) for pattern in self.exclude_content_patterns)
+            )
 
+    def excludes(self, text: str) -> bool:
+        """Check whether text contains any of the exclude patterns (case-insensitive)."""
+        if self._exclude_automaton is not None:
+            # Stops at the first hit
+            return next(self._exclude_automaton.iter(text.lower()), None) is not None
+        if self._exclude_re is not None:
+            return self._exclude_re.search(text.lower()) is not None
+        return False
 
-@dataclass
+
+@_slotted_dataclass
 class ScraperConfig:
     """Main configuration class for the scraper."""
     output_file: str = "output.json"
     team_id: str = "aline123"
     pdf_directory: str = "Books_PDF"
-    max_workers: int = 3
+    max_workers: Optional[int] = None  # None (or 'auto' in YAML) means DEFAULT_MAX_WORKERS
     request_delay: float = 0.2
     timeout: int = 15
+    # Fetch article batches with httpx on one event loop; opt-in because it
+    # bypasses the shared session's connection pool and status retries
+    async_fetch: bool = False
     headers: Dict[str, str] = None
     targets: List[ScrapingTarget] = None
     site_configs: Dict[str, Any] = None
     pdf_processing: Dict[str, Any] = None
     zenrows_config: Dict[str, Any] = None
+    # Derived lookups, rebuilt by reindex_targets()
+    _by_name: Dict[str, ScrapingTarget] = field(default=None, init=False, repr=False, compare=False)
+    _enabled: List[ScrapingTarget] = field(default=None, init=False, repr=False, compare=False)
+    _disabled: List[ScrapingTarget] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.headers is None:
@@ -67,6 +172,21 @@ class ScraperConfig:
             self.pdf_processing = {'enabled': True}
         if self.zenrows_config is None:
             self.zenrows_config = {'enabled': False}
+        self.reindex_targets()
+
+    def reindex_targets(self):
+        """Rebuild the name and enabled/disabled lookups; call after mutating targets."""
+        self._by_name = {}
+        self._enabled = []
+        self._disabled = []
+        for target in self.targets:
+            # First match wins, as with the previous linear scan
+            self._by_name.setdefault(target.name.lower(), target)
+            (self._enabled if target.enabled else self._disabled).append(target)
+    
+    def worker_count(self, tasks: int) -> int:
+        """Number of I/O workers to use for the given number of tasks."""
+        return max(1, min(self.max_workers or DEFAULT_MAX_WORKERS, tasks))
 
 
 class ConfigLoader:
@@ -91,16 +211,91 @@ class ConfigLoader:
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
+        stat = os.stat(config_path)
+        config = ConfigLoader._cached_load(
+            os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size
+        )
+        # Callers reassign top-level settings (e.g. --output) and may filter the
+        # targets list, so hand out a shallow copy with its own list. Targets and
+        # the header/site dicts stay shared with the cache and must not be mutated.
+        config = copy.copy(config)
+        config.targets = list(config.targets)
+        config.reindex_targets()
+        return config
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _cached_load(config_path: str, mtime_ns: int, size: int) -> ScraperConfig:
+        """Load and parse a config file, memoized on its path, mtime and size."""
+        # Reuse the YAML data from a previous run if the file is unchanged;
+        # YAML parsing is the slow part, building the dataclasses is cheap
+        cache_key = [CONFIG_CACHE_VERSION, mtime_ns, size]
+        cache_path = config_path + CONFIG_CACHE_SUFFIX
+        config_data = ConfigLoader._read_config_cache(cache_path, cache_key)
+        if config_data is None:
+            try:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    config_data = yaml.load(f, Loader=_YamlLoader)
+            except yaml.YAMLError as e:
+                raise yaml.YAMLError(f"Invalid YAML in config file: {e}")
+            
+            if not config_data:
+                raise ValueError("Configuration file is empty")
+            
+            ConfigLoader._write_config_cache(cache_path, cache_key, config_data)
+        
+        return ConfigLoader._parse_config(config_data)
+    
+    @staticmethod
+    def clear_cache():
+        """Forget configs memoized by load_config in this process."""
+        ConfigLoader._cached_load.cache_clear()
+    
+    @staticmethod
+    def _read_config_cache(cache_path: str, cache_key: list) -> Optional[Dict[str, Any]]:
+        """Return the cached YAML data if the sidecar exists and matches the key."""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise yaml.YAMLError(f"Invalid YAML in config file: {e}")
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            # Missing, unreadable or corrupt cache - just re-parse
+            return None
         
-        if not config_data:
-            raise ValueError("Configuration file is empty")
+        if not isinstance(cached, dict) or cached.get('key') != cache_key:
+            return None
+        config_data = cached.get('data')
+        return config_data if isinstance(config_data, dict) and config_data else None
+    
+    @staticmethod
+    def _write_config_cache(cache_path: str, cache_key: list, config_data: Dict[str, Any]):
+        """Atomically write the YAML data to the sidecar cache file."""
+        try:
+            payload = json.dumps({'key': cache_key, 'data': config_data})
+        except (TypeError, ValueError):
+            # YAML values JSON can't hold (dates, sets, ...) - skip caching
+            return
+        if json.loads(payload)['data'] != config_data:
+            # Non-string keys or tuples wouldn't round-trip unchanged
+            return
         
-        return ConfigLoader._parse_config(config_data)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Caching is best-effort (e.g. read-only config directory)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    @staticmethod
+    def _parse_max_workers(value: Any) -> Optional[int]:
+        """Parse the max_workers setting; missing or 'auto' selects the I/O-scaled default."""
+        if value is None or (isinstance(value, str) and value.lower() == 'auto'):
+            return None
+        return int(value)
     
     @staticmethod
     def _parse_config(config_data: Dict[str, Any]) -> ScraperConfig:
@@ -138,7 +333,7 @@ class ConfigLoader:
                 target = ScrapingTarget(
                     name=name,
                     url=url,
-                    type=source_data.get('type', 'blog'),
+                    type=_intern(source_data.get('type', 'blog')),
                     enabled=source_data.get('enabled', True),
                     # Use defaults for automatic detection
                     article_link_selector="",
@@ -147,7 +342,7 @@ class ConfigLoader:
                     content_selectors=[],
                     author_selector="",
                     author_extraction="",
-                    default_author=fallback_author,  # Use fallback author from config
+                    default_author=_intern(fallback_author),  # Use fallback author from config
                     content_elements=[],
                     content_min_length=50,
                     exclude_content_patterns=[],
@@ -158,23 +353,13 @@ class ConfigLoader:
         # Fall back to old 'targets' format for backward compatibility
         elif 'targets' in config_data:
             for target_data in config_data.get('targets', []):
-                target = ScrapingTarget(
-                    name=target_data.get('name', ''),
-                    url=target_data.get('url', ''),
-                    type=target_data.get('type', 'blog'),
-                    enabled=target_data.get('enabled', True),
-                    article_link_selector=target_data.get('article_link_selector', ''),
-                    article_link_filter=target_data.get('article_link_filter', ''),
-                    title_selector=target_data.get('title_selector', 'h1'),
-                    content_selectors=target_data.get('content_selectors', []),
-                    author_selector=target_data.get('author_selector', ''),
-                    author_extraction=target_data.get('author_extraction', ''),
-                    default_author=target_data.get('default_author', ''),
-                    content_elements=target_data.get('content_elements', []),
-                    content_min_length=target_data.get('content_min_length', 50),
-                    exclude_content_patterns=target_data.get('exclude_content_patterns', []),
-                    discovery_pages=target_data.get('discovery_pages', [])
-                )
+                # Overlay the target on the defaults in one C-level merge
+                merged = {**_TARGET_DEFAULTS, **target_data}
+                for key in _INTERNED_TARGET_FIELDS:
+                    merged[key] = _intern(merged[key])
+                if merged['content_elements']:
+                    merged['content_elements'] = [_intern(element) for element in merged['content_elements']]
+                target = ScrapingTarget(**{key: merged[key] for key in _TARGET_DEFAULTS})
                 targets.append(target)
         
         # Create main config object
@@ -182,9 +367,10 @@ class ConfigLoader:
             output_file=settings.get('output_file', 'output.json'),
             team_id=settings.get('team_id', 'aline123'),
             pdf_directory=settings.get('pdf_directory', 'Books_PDF'),
-            max_workers=settings.get('max_workers', 3),
+            max_workers=ConfigLoader._parse_max_workers(settings.get('max_workers')),
             request_delay=settings.get('request_delay', 0.2),
             timeout=settings.get('timeout', 15),
+            async_fetch=bool(settings.get('async_fetch', False)),
             headers=headers,
             targets=targets,
             site_configs=site_configs,
@@ -197,46 +383,48 @@ class ConfigLoader:
     @staticmethod
     def get_enabled_targets(config: ScraperConfig) -> List[ScrapingTarget]:
         """Get only the enabled scraping targets from the configuration."""
-        return [target for target in config.targets if target.enabled]
+        return config._enabled
+    
+    @staticmethod
+    def get_disabled_targets(config: ScraperConfig) -> List[ScrapingTarget]:
+        """Get only the disabled scraping targets from the configuration."""
+        return config._disabled
     
     @staticmethod
     def get_target_by_name(config: ScraperConfig, name: str) -> Optional[ScrapingTarget]:
         """Get a specific target by name."""
-        for target in config.targets:
-            if target.name.lower() == name.lower():
-                return target
-        return None
+        return config._by_name.get(name.lower())
     
     @staticmethod
-    def validate_config(config: ScraperConfig) -> List[str]:
+    def validate_config(config: ScraperConfig) -> Iterator[str]:
         """
-        Validate the configuration and return a list of validation errors.
+        Validate the configuration, yielding validation errors lazily.
         
-        Returns:
-            List of error messages, empty if config is valid
-        """
-        errors = []
+        Callers that only need to know whether the config is valid can stop
+        after the first error instead of walking every target.
         
+        Yields:
+            Error messages; nothing if the config is valid
+        """
         if not config.team_id:
-            errors.append("team_id is required in settings")
+            yield "team_id is required in settings"
         
         if not config.output_file:
-            errors.append("output_file is required in settings")
+            yield "output_file is required in settings"
         
-        if config.max_workers < 1:
-            errors.append("max_workers must be at least 1")
+        if config.max_workers is not None and config.max_workers < 1:
+            yield "max_workers must be at least 1"
         
         if config.request_delay < 0:
-            errors.append("request_delay must be non-negative")
+            yield "request_delay must be non-negative"
         
-        for i, target in enumerate(config.targets):
-            if not target.name:
-                errors.append(f"Target {i+1}: name is required")
+        for i, target in enumerate(config.targets, 1):
+            name = target.name
+            if not name:
+                yield f"Target {i}: name is required"
             
             if not target.url:
-                errors.append(f"Target '{target.name}': url is required")
+                yield f"Target '{name}': url is required"
             
             if not target.type:
-                errors.append(f"Target '{target.name}': type is required")
-        
-        return errors 
\ No newline at end of file
+                yield f"Target '{name}': type is required"
@@ -0,0 +1,58 @@
+"""
+Content-based deduplication of scraped items.
+Different URLs (discovery pages, targets, mirrors) often yield the same article;
+items are keyed by a short hash of their normalized content text.
+"""
+
+import hashlib
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+_MONTH = (r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+          r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?')
+
+# Dates, times and reading times vary between copies of one article. Other
+# numbers stay, since "Top 5 ..." and "Top 10 ..." are different articles.
+# Matched against lowercased text.
+_DATE_TIME_RE = re.compile(
+    r'\b\d{4}-\d{2}-\d{2}(?:[t ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:z|[+-]\d{2}:?\d{2})?)?\b'  # ISO date/timestamp
+    r'|\b(?:\d{4}/\d{1,2}/\d{1,2}|\d{1,2}/\d{1,2}/\d{2,4}|\d{1,2}\.\d{1,2}\.\d{4})\b'  # 2024/01/15, 15.01.2024
+    rf'|\b{_MONTH}\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{4}}\b'       # January 15, 2024
+    rf'|\b\d{{1,2}}(?:st|nd|rd|th)?\s+{_MONTH},?\s+\d{{4}}\b'       # 15 January 2024
+    r'|\b\d{1,2}:\d{2}(?::\d{2})?(?:\s*[ap]\.?m\.?)?(?!\w)'          # 12:34, 3:05 pm
+    r'|\b\d+\s*min(?:ute)?s?\s+read\b'                          # 3 min read
+)
+
+
+def content_digest(text: str) -> bytes:
+    """Return a 64-bit digest of the text, ignoring case, dates/times and whitespace differences."""
+    # split()/join collapses whitespace runs and trims the ends in one pass,
+    # instead of a second regex substitution followed by strip()
+    normalized = ' '.join(_DATE_TIME_RE.sub('', text.lower()).split())
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest()
+
+
+def dedupe_items(items: Iterable[Dict[str, Any]], seen: Optional[Set[bytes]] = None) -> List[Dict[str, Any]]:
+    """
+    Drop items whose content duplicates an earlier item, keeping first occurrences in order.
+    
+    Args:
+        items: Scraped items with a 'content' field
+        seen: Digests already emitted; pass the same set to dedupe across calls
+        
+    Returns:
+        Items with duplicate content removed (items without content are kept)
+    """
+    if seen is None:
+        seen = set()
+    
+    unique = []
+    for item in items:
+        content = item.get('content')
+        if content:
+            digest = content_digest(content)
+            if digest in seen:
+                continue
+            seen.add(digest)
+        unique.append(item)
+    return unique
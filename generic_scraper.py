@@ -4,26 +4,138 @@ This module provides a flexible scraper that works with YAML configuration files
 It complements the UniversalScraper by offering structured, configuration-based scraping.
 """
 
+import asyncio
 import concurrent.futures
+import importlib.util
 import re
-import time
-from urllib.parse import urljoin
-from typing import List, Dict, Any, Optional
+from urllib.parse import urljoin, urlsplit, urlunsplit
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 import requests
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 
-from config_loader import ScrapingTarget, ScraperConfig
+from config_loader import DEFAULT_MAX_WORKERS, ScrapingTarget, ScraperConfig
+from content_dedupe import dedupe_items
+from http_session import ResponseTooLarge, create_session, fetch_page, fetch_page_async
+from rate_limiter import HostRateLimiter
+
+# Prefer the C-backed lxml parser; fall back to the pure-Python one if it's missing
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Optional: selectolax's lexbor backend parses and runs CSS selectors far faster than bs4
+try:
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+except ImportError:
+    LexborHTMLParser = None
+
+# Optional: with async_fetch, httpx fetches article batches from one event loop instead of
+# a blocking thread per request (over HTTP/2 when the h2 package is installed)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Elements collected from a content container when the target doesn't name its own
+DEFAULT_CONTENT_ELEMENTS = 'p, ul li, ol li, h2, h3, h4'
+
+# Markdown formatting per content element tag; anything else is kept as plain text
+_CONTENT_FORMATS = {
+    'h2': '## {text}',
+    'h3': '### {text}',
+    'h4': '#### {text}',
+    'li': '• {text}',
+    'blockquote': '> {text}',
+    'code': '`{text}`',
+    'pre': '```\n{text}\n```',
+    'a': '[{text}]({href})',
+}
+
+# Target-independent selectors, compiled once for every page
+_DEFAULT_CONTENT_SELECTOR = soupsieve.compile(DEFAULT_CONTENT_ELEMENTS)
+_PARAGRAPH_SELECTOR = soupsieve.compile('p')
+_AUTHOR_META_SELECTORS = [
+    soupsieve.compile('meta[name="author"]'),
+    soupsieve.compile('meta[property="article:author"]'),
+]
+
+# A single tag-led compound selector (e.g. "div.post-body", "a[href]") with no
+# descendant/child/sibling combinators, so the tag alone decides what to keep
+_SIMPLE_SELECTOR_RE = re.compile(r'^([A-Za-z][A-Za-z0-9]*)(?:[.#\[:][^\s>+~]*)?$')
+
+# Text node introducing the author for targets using byline_text extraction
+BYLINE_RE = re.compile(r'By\s+')
+
+
+def has_byline(text: str) -> bool:
+    """Check whether a text node matches BYLINE_RE, running the regex only on nodes containing 'By'."""
+    return 'By' in text and BYLINE_RE.search(text) is not None
+
+# Query parameters that only track where a click came from, never what page it is
+_TRACKING_PARAMS = {'ref', 'fbclid', 'gclid', 'mc_cid', 'mc_eid'}
+
+
+def _selector_tags(selectors: List[str]) -> Optional[set]:
+    """
+    Return the leading tag names of the given CSS selectors, or None if any
+    selector can't be satisfied from those tags' subtrees alone.
+    """
+    tags = set()
+    for selector in selectors:
+        for part in selector.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            match = _SIMPLE_SELECTOR_RE.match(part)
+            if not match:
+                return None
+            tags.add(match.group(1).lower())
+    return tags
+
+
+def _canonicalize_url(url: str) -> str:
+    """
+    Normalize an article URL so trivially different links dedupe to one fetch:
+    drops the fragment and tracking parameters, sorts the remaining query and
+    lowercases the scheme and host.
+    """
+    parts = urlsplit(url)
+    # Work on the raw "key=value" pairs so their original encoding is kept
+    query = sorted(
+        pair for pair in parts.query.split('&')
+        if pair and not pair.startswith('utm_') and pair.partition('=')[0] not in _TRACKING_PARAMS
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, '&'.join(query), ''))
 
 
 class GenericScraper:
     """A configuration-driven scraper that can handle multiple sites."""
     
-    def __init__(self, config: ScraperConfig):
+    def __init__(self, config: ScraperConfig, session: Optional[requests.Session] = None):
+        """
+        Initialize the scraper.
+        
+        Args:
+            config: Main scraper configuration
+            session: Shared session to reuse across scrapers; one is created if omitted
+        """
         self.config = config
-        self.session = requests.Session()
+        if session is None:
+            session = create_session(max_workers=config.max_workers or DEFAULT_MAX_WORKERS)
+        self.session = session
         self.session.headers.update(config.headers)
+        
+        # Space out requests per host inside the workers
+        self.rate_limiter = HostRateLimiter(config.request_delay)
+        # Compiled CSS selectors per target name, built on first use
+        self._compiled: Dict[str, Dict[str, Any]] = {}
+        # Targets whose selectors lexbor rejects or matches differently from soupsieve
+        self._bs4_only_targets: Set[str] = set()
         self.zenrows_scraper = None
         
         # Initialize ZenRows scraper if enabled
@@ -63,8 +175,8 @@ class GenericScraper:
         
         print(f"  📄 Found {len(article_urls)} articles to scrape")
         
-        # Scrape articles in parallel
-        return self._scrape_articles_parallel(article_urls, target)
+        # Scrape articles in parallel, dropping pages that turn out to be the same article
+        return dedupe_items(self._scrape_articles_parallel(article_urls, target))
     
     def _discover_article_urls(self, target: ScrapingTarget) -> List[str]:
         """Discover article URLs from the main page or discovery pages."""
@@ -79,12 +191,19 @@ class GenericScraper:
         for search_url in search_urls:
             try:
                 print(f"  🔍 Discovering articles from: {search_url}")
-                response = self.session.get(search_url, timeout=self.config.timeout)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                self.rate_limiter.wait(search_url)
+                html = fetch_page(self.session, search_url, self.config.timeout)
+                
+                # Only build <a> elements when the link selector can match on them alone
+                strainer = self._link_strainer(target)
+                soup = BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+                link_selector = self._compiled_selectors(target)['article_link']
+                links = link_selector.select(soup) if link_selector else []
+                if not links and strainer is not None and link_selector:
+                    soup = BeautifulSoup(html, HTML_PARSER)
+                    links = link_selector.select(soup)
                 
                 # Find article links
-                links = soup.select(target.article_link_selector)
                 for link in links:
                     href = link.get('href')
                     if href:
@@ -92,9 +211,9 @@ class GenericScraper:
                         if target.article_link_filter and target.article_link_filter not in href:
                             continue
                         
-                        # Convert to absolute URL
+                        # Convert to absolute URL, canonicalized so duplicates fetch once
                         full_url = urljoin(search_url, href)
-                        all_urls.add(full_url)
+                        all_urls.add(_canonicalize_url(full_url))
                 
             except requests.exceptions.RequestException as e:
                 print(f"  ❌ Error discovering from {search_url}: {e}")
@@ -108,19 +227,25 @@ class GenericScraper:
                         zenrows_urls = self.zenrows_scraper.scrape_articles_from_page(
                             search_url, target, use_premium
                         )
-                        all_urls.update(zenrows_urls)
+                        all_urls.update(_canonicalize_url(url) for url in zenrows_urls)
                     except Exception as zenrows_e:
                         print(f"  ❌ ZenRows discovery also failed: {zenrows_e}")
                 
                 continue
+            
+            except ResponseTooLarge as e:
+                print(f"  ❌ Skipping {search_url}: {e}")
         
         return list(all_urls)
     
     def _scrape_articles_parallel(self, urls: List[str], target: ScrapingTarget) -> List[Dict[str, Any]]:
         """Scrape multiple articles in parallel."""
+        if self.config.async_fetch and httpx is not None:
+            return asyncio.run(self._scrape_articles_async(urls, target))
+        
         items = []
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.worker_count(len(urls))) as executor:
             future_to_url = {
                 executor.submit(self._scrape_single_article, url, target): url 
                 for url in urls
@@ -134,26 +259,75 @@ class GenericScraper:
                         items.append(result)
                 except Exception as exc:
                     print(f"  ❌ Error scraping {url}: {exc}")
-                
-                # Rate limiting
-                time.sleep(self.config.request_delay)
         
         return items
     
+    async def _scrape_articles_async(self, urls: List[str], target: ScrapingTarget) -> List[Dict[str, Any]]:
+        """Scrape multiple articles concurrently on one event loop with httpx."""
+        max_workers = self.config.worker_count(len(urls))
+        semaphore = asyncio.Semaphore(max_workers)
+        limits = httpx.Limits(
+            max_connections=max(max_workers * 2, 10),
+            max_keepalive_connections=max(max_workers, 10)
+        )
+        
+        async with httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            headers=self.config.headers,
+            timeout=self.config.timeout,
+            limits=limits,
+            follow_redirects=True
+        ) as client:
+            async def scrape(url: str) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    await asyncio.sleep(self.rate_limiter.reserve(url))
+                    return await self._scrape_single_article_async(client, url, target)
+            
+            results = await asyncio.gather(*(scrape(url) for url in urls), return_exceptions=True)
+        
+        items = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                print(f"  ❌ Error scraping {url}: {result}")
+            elif result:
+                items.append(result)
+        return items
+    
     def _scrape_single_article(self, url: str, target: ScrapingTarget) -> Optional[Dict[str, Any]]:
         """Scrape a single article."""
         print(f"  📖 Scraping: {url}")
         
         try:
-            response = self.session.get(url, timeout=self.config.timeout)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract title
-            title = self._extract_title(soup, target)
-            
-            # Extract content
-            content = self._extract_content(soup, target)
+            self.rate_limiter.wait(url)
+            html = fetch_page(self.session, url, self.config.timeout)
+        except requests.exceptions.RequestException as e:
+            print(f"    ❌ Network error: {e}")
+            return self._fallback_for_network_error(url, target)
+        except ResponseTooLarge as e:
+            print(f"    ❌ Skipping: {e}")
+            return None
+        
+        return self._process_article(url, html, target)
+    
+    async def _scrape_single_article_async(self, client, url: str, target: ScrapingTarget) -> Optional[Dict[str, Any]]:
+        """Scrape a single article with an httpx.AsyncClient, parsing off the event loop."""
+        print(f"  📖 Scraping: {url}")
+        
+        try:
+            html = await fetch_page_async(client, url)
+        except httpx.HTTPError as e:
+            print(f"    ❌ Network error: {e}")
+            return await asyncio.to_thread(self._fallback_for_network_error, url, target)
+        except ResponseTooLarge as e:
+            print(f"    ❌ Skipping: {e}")
+            return None
+        
+        return await asyncio.to_thread(self._process_article, url, html, target)
+    
+    def _process_article(self, url: str, html: bytes, target: ScrapingTarget) -> Optional[Dict[str, Any]]:
+        """Turn a fetched article page into a scraped item, falling back to ZenRows if it has no content."""
+        try:
+            title, content, author = self._parse_article(html, target)
             if not content:
                 print(f"    ⚠️  No content found for {url}")
                 
@@ -166,9 +340,6 @@ class GenericScraper:
                 
                 return None
             
-            # Extract author
-            author = self._extract_author(soup, target)
-            
             print(f"    ✅ Title: '{title}' ({len(content)} chars)")
             
             return {
@@ -180,24 +351,99 @@ class GenericScraper:
                 "user_id": ""
             }
             
-        except requests.exceptions.RequestException as e:
-            print(f"    ❌ Network error: {e}")
-            
-            # Try ZenRows fallback if available and enabled
-            if (self.zenrows_scraper and 
-                self.config.zenrows_config.get('fallback_for_network_errors', True)):
-                print(f"    🚀 Trying ZenRows fallback for network error...")
-                use_premium = self.config.zenrows_config.get('use_premium_for_errors', True)
-                return self.zenrows_scraper.scrape_url(url, target, use_premium)
-            
-            return None
         except Exception as e:
             print(f"    ❌ Processing error: {e}")
             return None
     
+    def _fallback_for_network_error(self, url: str, target: ScrapingTarget) -> Optional[Dict[str, Any]]:
+        """Retry a failed fetch through ZenRows if available and enabled."""
+        if (self.zenrows_scraper and 
+            self.config.zenrows_config.get('fallback_for_network_errors', True)):
+            print(f"    🚀 Trying ZenRows fallback for network error...")
+            use_premium = self.config.zenrows_config.get('use_premium_for_errors', True)
+            return self.zenrows_scraper.scrape_url(url, target, use_premium)
+        
+        return None
+    
+    def _parse_article(self, html: bytes, target: ScrapingTarget) -> Tuple[str, str, str]:
+        """Parse an article page and extract its title, content and author."""
+        # Byline extraction needs bs4's regex search over text nodes
+        tried_lexbor = (LexborHTMLParser is not None and target.author_extraction != "byline_text"
+                        and target.name not in self._bs4_only_targets)
+        if tried_lexbor:
+            try:
+                tree = LexborHTMLParser(html)
+                title = self._extract_title_lexbor(tree, target)
+                content = self._extract_content_lexbor(tree, target)
+                author = self._extract_author_lexbor(tree, target)
+            except SelectolaxError:
+                # A soupsieve-only selector (e.g. :-soup-contains()); use bs4 for this target from now on
+                self._bs4_only_targets.add(target.name)
+            else:
+                if content:
+                    return title, content, author
+                # Nothing matched; bs4 decides whether that's the page or lexbor's selector support
+        
+        # Parse only the subtrees the configured selectors can match
+        strainer = self._article_strainer(target)
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+        title = self._extract_title(soup, target)
+        content = self._extract_content(soup, target)
+        if not content and strainer is not None:
+            # The page-wide paragraph fallback needs the full document
+            soup = BeautifulSoup(html, HTML_PARSER)
+            title = self._extract_title(soup, target)
+            content = self._extract_content(soup, target)
+        
+        if content and tried_lexbor:
+            # bs4 found what lexbor missed, so its selectors don't translate
+            self._bs4_only_targets.add(target.name)
+        
+        return title, content, self._extract_author(soup, target)
+    
+    def _compiled_selectors(self, target: ScrapingTarget) -> Dict[str, Any]:
+        """Return the target's CSS selectors compiled with soupsieve, compiling them on first use."""
+        compiled = self._compiled.get(target.name)
+        if compiled is None:
+            compiled = {
+                'article_link': soupsieve.compile(target.article_link_selector) if target.article_link_selector else None,
+                'title': soupsieve.compile(target.title_selector) if target.title_selector else None,
+                'content': [soupsieve.compile(selector) for selector in target.content_selectors],
+                'content_elements': (soupsieve.compile(', '.join(target.content_elements))
+                                     if target.content_elements else _DEFAULT_CONTENT_SELECTOR),
+                'author': soupsieve.compile(target.author_selector) if target.author_selector else None,
+            }
+            # Worker threads may race to build this; either result is equivalent
+            self._compiled[target.name] = compiled
+        return compiled
+    
+    def _link_strainer(self, target: ScrapingTarget) -> Optional[SoupStrainer]:
+        """Build a strainer keeping only links, if the link selector targets <a> tags alone."""
+        tags = _selector_tags([target.article_link_selector])
+        if tags != {'a'}:
+            return None
+        return SoupStrainer('a', href=True)
+    
+    def _article_strainer(self, target: ScrapingTarget) -> Optional[SoupStrainer]:
+        """Build a strainer for the title, content and author selectors, or None to parse everything."""
+        # Byline extraction searches text anywhere on the page
+        if target.author_extraction == "byline_text" or not target.content_selectors:
+            return None
+        
+        selectors = target.content_selectors + [target.title_selector]
+        if target.author_selector:
+            selectors.append(target.author_selector)
+        tags = _selector_tags(selectors)
+        if not tags:
+            return None
+        
+        # Keep <meta> for the author meta-tag fallback
+        return SoupStrainer(list(tags | {'meta'}))
+    
     def _extract_title(self, soup: BeautifulSoup, target: ScrapingTarget) -> str:
         """Extract the title from the page."""
-        title_element = soup.select_one(target.title_selector)
+        title_selector = self._compiled_selectors(target)['title']
+        title_element = title_selector.select_one(soup) if title_selector else None
         if title_element:
             return title_element.get_text(strip=True)
         return "No Title Found"
@@ -205,63 +451,60 @@ class GenericScraper:
     def _extract_content(self, soup: BeautifulSoup, target: ScrapingTarget) -> str:
         """Extract the main content from the page."""
         content_paragraphs = []
+        compiled = self._compiled_selectors(target)
+        # Either the target's own content elements or all paragraphs and lists
+        element_selector = compiled['content_elements']
+        min_length = target.content_min_length
+        excludes = target.excludes
+        process = self._process_content_element
         
         # Try each content selector until we find content
-        for selector in target.content_selectors:
-            content_container = soup.select_one(selector)
+        for selector in compiled['content']:
+            content_container = selector.select_one(soup)
             if content_container:
-                # If specific content elements are defined, use them
-                if target.content_elements:
-                    elements = content_container.select(', '.join(target.content_elements))
-                    for element in elements:
-                        text = self._process_content_element(element)
-                        if text and len(text) >= target.content_min_length:
-                            if not self._should_exclude_content(text, target):
-                                content_paragraphs.append(text)
-                else:
-                    # Extract all paragraphs and lists
-                    elements = content_container.select('p, ul li, ol li, h2, h3, h4')
-                    for element in elements:
-                        text = self._process_content_element(element)
-                        if text and len(text) >= target.content_min_length:
-                            if not self._should_exclude_content(text, target):
-                                content_paragraphs.append(text)
+                # Format, length-check and filter each element in a single pass
+                content_paragraphs = [
+                    text for text in (
+                        process(element)
+                        for element in element_selector.select(content_container)
+                    )
+                    if text and len(text) >= min_length and not excludes(text)
+                ]
                 
                 # If we found content, break out of the selector loop
                 if content_paragraphs:
                     break
         
-        # Fallback: try to get content from the entire page
+        # Fallback: try to get content from the entire page (higher threshold)
         if not content_paragraphs:
-            all_paragraphs = soup.select('p')
-            for p in all_paragraphs:
-                text = p.get_text(strip=True)
-                if (text and len(text) >= target.content_min_length * 2 and  # Higher threshold for fallback
-                    not self._should_exclude_content(text, target)):
-                    content_paragraphs.append(text)
+            content_paragraphs = [
+                text for text in (p.get_text(strip=True) for p in _PARAGRAPH_SELECTOR.select(soup))
+                if text and len(text) >= min_length * 2 and not excludes(text)
+            ]
         
         return "\n\n".join(content_paragraphs)
     
     def _process_content_element(self, element) -> str:
         """Process a single content element and return formatted text."""
-        if element.name in ['h2', 'h3', 'h4']:
-            # Format headings with markdown
-            level = int(element.name[1])
-            return f"{'#' * level} {element.get_text(strip=True)}"
-        elif element.name == 'li':
-            # Format list items
-            return f"• {element.get_text(strip=True)}"
-        else:
+        fmt = _CONTENT_FORMATS.get(element.name)
+        if fmt is None:
             # Regular content
             return element.get_text(strip=True)
+        # Code blocks keep their line breaks
+        text = element.get_text().strip('\n') if element.name == 'pre' else element.get_text(strip=True)
+        return fmt.format(text=text, href=element.get('href', ''))
     
-    def _should_exclude_content(self, text: str, target: ScrapingTarget) -> bool:
-        """Check if content should be excluded based on patterns."""
-        text_lower = text.lower()
-        for pattern in target.exclude_content_patterns:
-            if pattern.lower() in text_lower:
-                return True
-        return False
+    def _process_content_node(self, node) -> str:
+        """
+        Process a selectolax content node the same way as _process_content_element.
+        
+        Subclasses that change the formatting should override both methods.
+        """
+        fmt = _CONTENT_FORMATS.get(node.tag)
+        if fmt is None:
+            return node.text(strip=True)
+        text = node.text(strip=False).strip('\n') if node.tag == 'pre' else node.text(strip=True)
+        return fmt.format(text=text, href=node.attributes.get('href') or '')
     
     def _extract_author(self, soup: BeautifulSoup, target: ScrapingTarget) -> str:
         """Extract author information."""
@@ -274,8 +517,9 @@ class GenericScraper:
             return self._extract_author_byline(soup)
         
         # Try the author selector
-        if target.author_selector:
-            author_element = soup.select_one(target.author_selector)
+        author_selector = self._compiled_selectors(target)['author']
+        if author_selector:
+            author_element = author_selector.select_one(soup)
             if author_element:
                 # Check if it's a meta tag
                 if author_element.name == 'meta' and 'content' in author_element.attrs:
@@ -284,16 +528,76 @@ class GenericScraper:
                     return author_element.get_text(strip=True)
         
         # Try common meta tags
-        for meta_selector in ['meta[name="author"]', 'meta[property="article:author"]']:
-            meta_element = soup.select_one(meta_selector)
+        for meta_selector in _AUTHOR_META_SELECTORS:
+            meta_element = meta_selector.select_one(soup)
             if meta_element and 'content' in meta_element.attrs:
                 return meta_element['content']
         
         return ""
     
+    def _extract_title_lexbor(self, tree, target: ScrapingTarget) -> str:
+        """Extract the title from a selectolax tree."""
+        title_node = tree.css_first(target.title_selector)
+        if title_node:
+            return title_node.text(strip=True)
+        return "No Title Found"
+    
+    def _extract_content_lexbor(self, tree, target: ScrapingTarget) -> str:
+        """Extract the main content from a selectolax tree (mirrors _extract_content)."""
+        content_paragraphs = []
+        element_selector = ', '.join(target.content_elements) if target.content_elements else DEFAULT_CONTENT_ELEMENTS
+        min_length = target.content_min_length
+        excludes = target.excludes
+        
+        # Try each content selector until we find content
+        for selector in target.content_selectors:
+            content_container = tree.css_first(selector)
+            if content_container:
+                # Unlike bs4, lexbor yields a node once per matching selector in the list
+                seen = set()
+                for node in content_container.css(element_selector):
+                    if node.mem_id in seen:
+                        continue
+                    seen.add(node.mem_id)
+                    text = self._process_content_node(node)
+                    if text and len(text) >= min_length and not excludes(text):
+                        content_paragraphs.append(text)
+                
+                if content_paragraphs:
+                    break
+        
+        # Fallback: try to get content from the entire page
+        if not content_paragraphs:
+            content_paragraphs = [
+                text for text in (node.text(strip=True) for node in tree.css('p'))
+                if text and len(text) >= min_length * 2 and not excludes(text)
+            ]
+        
+        return "\n\n".join(content_paragraphs)
+    
+    def _extract_author_lexbor(self, tree, target: ScrapingTarget) -> str:
+        """Extract author information from a selectolax tree (no byline support)."""
+        if target.default_author:
+            return target.default_author
+        
+        if target.author_selector:
+            author_node = tree.css_first(target.author_selector)
+            if author_node:
+                if author_node.tag == 'meta' and 'content' in author_node.attributes:
+                    return author_node.attributes['content'] or ""
+                else:
+                    return author_node.text(strip=True)
+        
+        for meta_selector in ['meta[name="author"]', 'meta[property="article:author"]']:
+            meta_node = tree.css_first(meta_selector)
+            if meta_node and 'content' in meta_node.attributes:
+                return meta_node.attributes['content'] or ""
+        
+        return ""
+    
     def _extract_author_byline(self, soup: BeautifulSoup) -> str:
         """Extract author from byline text (custom method for interviewing.io)."""
-        byline_element = soup.find(text=re.compile(r'By\s+'))
+        byline_element = soup.find(string=has_byline)
         if byline_element:
             byline_text = byline_element.strip()
             if "By " in byline_text and "|" in byline_text:
@@ -0,0 +1,121 @@
+"""
+Shared HTTP session setup for the scrapers.
+One tuned session can be handed to every scraper in a run so that requests to the
+same host reuse pooled keep-alive connections instead of re-handshaking per target.
+"""
+
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Pages past this size are refused instead of being buffered and parsed
+MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+
+
+def create_session(headers: Optional[Dict[str, str]] = None, max_workers: int = 10,
+                   status_retries: bool = True) -> requests.Session:
+    """
+    Create a requests session with a worker-sized, retrying connection pool.
+    
+    Args:
+        headers: Default headers to send with every request
+        max_workers: Number of threads expected to share the session
+        status_retries: Retry 429/5xx responses and read errors. Turn off for
+            metered APIs, where every request that reached the server may be
+            billed; connection failures are still retried.
+        
+    Returns:
+        Configured requests.Session
+    """
+    # Accept-Encoding is left to requests: it offers br (and httpx does too) as soon
+    # as brotli is installed, and never advertises an encoding it can't decode
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    
+    # Size the connection pool to the worker count so concurrent requests to
+    # the same host reuse keep-alive connections instead of re-handshaking
+    if status_retries:
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET', 'HEAD']
+        )
+    else:
+        # Only retry requests that never reached the server
+        retry = Retry(total=3, read=0, status=0, backoff_factor=0.3, allowed_methods=['GET', 'HEAD'])
+    adapter = HTTPAdapter(
+        pool_connections=max(max_workers, 10),
+        pool_maxsize=max(max_workers * 2, 10),
+        max_retries=retry
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class ResponseTooLarge(Exception):
+    """Raised when a page body exceeds the allowed size."""
+
+
+def fetch_page(session: requests.Session, url: str, timeout: float,
+               max_bytes: int = MAX_RESPONSE_BYTES) -> bytes:
+    """
+    GET a page and return its body, refusing oversized pages without buffering them.
+    
+    Args:
+        session: Session to send the request with
+        url: Page URL
+        timeout: Request timeout in seconds
+        max_bytes: Largest body accepted
+        
+    Returns:
+        Raw response body
+        
+    Raises:
+        requests.exceptions.RequestException: On network errors and HTTP error statuses
+        ResponseTooLarge: If the declared or actual body size exceeds max_bytes
+    """
+    with session.get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        
+        # Trust an honest Content-Length to bail out before reading anything
+        declared = response.headers.get('Content-Length', '')
+        if declared.isdigit() and int(declared) > max_bytes:
+            raise ResponseTooLarge(f"{url} is {int(declared)} bytes (limit {max_bytes})")
+        
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ResponseTooLarge(f"{url} exceeds {max_bytes} bytes")
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+
+async def fetch_page_async(client, url: str, max_bytes: int = MAX_RESPONSE_BYTES) -> bytes:
+    """
+    Async counterpart of fetch_page for an httpx.AsyncClient.
+    
+    Raises:
+        httpx.HTTPError: On network errors and HTTP error statuses
+        ResponseTooLarge: If the declared or actual body size exceeds max_bytes
+    """
+    async with client.stream('GET', url) as response:
+        response.raise_for_status()
+        
+        declared = response.headers.get('Content-Length', '')
+        if declared.isdigit() and int(declared) > max_bytes:
+            raise ResponseTooLarge(f"{url} is {int(declared)} bytes (limit {max_bytes})")
+        
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) > max_bytes:
+                raise ResponseTooLarge(f"{url} exceeds {max_bytes} bytes")
+        return bytes(body)
@@ -0,0 +1,47 @@
+"""
+Per-host request rate limiting shared by the scrapers.
+Spaces out requests to the same host without serializing requests to different hosts.
+"""
+
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """Enforces a minimum interval between request starts to the same host."""
+    
+    def __init__(self, delay: float):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            delay: Minimum number of seconds between two requests to one host
+        """
+        self.delay = max(delay, 0)
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def reserve(self, url: str) -> float:
+        """
+        Reserve the next request slot for the URL's host.
+        
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        if not self.delay:
+            return 0.0
+        
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.delay
+        return slot - now
+    
+    def wait(self, url: str):
+        """Block the calling thread until a request to the URL's host is allowed."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
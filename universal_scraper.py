@@ -5,16 +5,123 @@ Enhanced to automatically scrape all sources from the original requirements.
 Now includes ZenRows API fallback for reliable scraping.
 """
 
+import asyncio
 import re
-import time
 import json
 import concurrent.futures
+import importlib.util
 from typing import List, Dict, Any, Optional, Tuple, Set
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urldefrag, urljoin, urlparse
 from collections import Counter
 
 import requests
-from bs4 import BeautifulSoup, Tag, NavigableString
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag, NavigableString
+from bs4.dammit import EncodingDetector
+
+from content_dedupe import dedupe_items
+from http_session import create_session, fetch_page, fetch_page_async
+from rate_limiter import HostRateLimiter
+
+# Prefer the C-backed lxml parser; fall back to the pure-Python one if it's missing
+try:
+    from lxml import html as lxml_html
+    HTML_PARSER = 'lxml'
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = 'html.parser'
+
+# Optional: with async_fetch, httpx fetches URL batches from one event loop instead of
+# a blocking thread per request (over HTTP/2 when the h2 package is installed)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Index pages that are only mined for hrefs skip bs4 entirely when lxml is
+# available (a compiled XPath), and otherwise parse nothing but their anchors
+_HREF_XPATH = lxml_html.etree.XPath('//a/@href') if lxml_html is not None else None
+_LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Tags whose counts feed ContentDetector._score_content_area
+_SCORED_TAGS = ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'a']
+
+# Patterns are compiled once at import instead of on every page, link or author candidate
+_NAME_CLASS = r"A-Za-z\s\.\-\'\u00C0-\u017F"
+_TITLE_SUFFIX_RE = re.compile(r'\s*[\|\-\–]\s*[^|]*$')
+_SITE_TITLE_RE = re.compile(r'^(home|blog|news|articles?)$|^[a-z]+\.(com|io|org|net)$')
+_HAS_LETTER_RE = re.compile(r'[A-Za-z]')
+_HAS_UPPERCASE_RE = re.compile(r'[A-Z]')
+_ASCII_NAME_CHARS_RE = re.compile(r'[A-Za-z\s\.\-\']')
+_NAME_CHARS_RE = re.compile(f'[{_NAME_CLASS}]')
+_NAME_RE = re.compile(f'^[{_NAME_CLASS}]+$')
+_WORD_RE = re.compile(r'\b\w+\b')
+_WHITESPACE_RE = re.compile(r'\s+')
+_AUTHOR_METADATA_RE = re.compile('|'.join((
+    r'^(published|updated|posted|edited|created|modified)',
+    r'^(tags?|categories?|topics?)',
+    r'^(share|follow|subscribe|comments?)',
+    r'^\d+\s+(min|hour|day|week|month|year)s?\s+(ago|read)',
+    r'^(january|february|march|april|may|june|july|august|september|october|november|december)',
+    r'^\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4}',
+    r'^(mon|tue|wed|thu|fri|sat|sun)',
+    r'every month', r'monthly', r'weekly', r'daily',
+)))
+# Byline patterns, tried in order
+_BYLINE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    rf'By\s+([{_NAME_CLASS}]+?)(?:\s*[\|\,\n\r\•]|\s*on\s|\s*\d{{1,2}}[\/\-]\d{{1,2}}|$)',
+    rf'Written by\s+([{_NAME_CLASS}]+?)(?:\s*[\|\,\n\r\•]|\s*on\s|\s*\d{{1,2}}[\/\-]\d{{1,2}}|$)',
+    rf'Author:\s*([{_NAME_CLASS}]+?)(?:\s*[\|\,\n\r\•]|\s*\d{{1,2}}[\/\-]\d{{1,2}}|$)',
+    rf'Posted by\s+([{_NAME_CLASS}]+?)(?:\s*[\|\,\n\r\•]|\s*on\s|\s*\d{{1,2}}[\/\-]\d{{1,2}}|$)',
+    rf'Published by\s+([{_NAME_CLASS}]+?)(?:\s*[\|\,\n\r\•]|\s*on\s|\s*\d{{1,2}}[\/\-]\d{{1,2}}|$)',
+))
+_BY_OR_AUTHOR_RE = re.compile(r'(by|author)', re.IGNORECASE)
+_HEADER_AUTHOR_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    rf'by\s+([{_NAME_CLASS}]+)',
+    rf'author[:\s]+([{_NAME_CLASS}]+)',
+))
+_CREDITS_RE = re.compile(r'credits', re.IGNORECASE)
+# Credit labels in order of preference
+_CREDIT_AUTHOR_LABELS = tuple(re.compile(label, re.IGNORECASE) for label in (
+    'creator and author',
+    'author and creator',
+    'creator & author',
+    'author & creator',
+    'author',
+    'creator',
+    'written by',
+    'by',
+))
+_AUTHOR_PREFIX_RE = re.compile(r'^(by|author:?|written by|posted by|published by)\s*', re.IGNORECASE)
+_AUTHOR_SUFFIX_RE = re.compile(r'\s*[\|\-\–]\s*.*$')
+_AUTHOR_DATE_SUFFIX_RE = re.compile(r'\s*on\s+\d{1,2}[\/\-]\d{1,2}.*$', re.IGNORECASE)
+_ASSET_EXTENSION_RE = re.compile(
+    r'\.(jpg|jpeg|png|gif|pdf|doc|docx|zip|mp3|mp4|css|js|ico|svg|woff|ttf)$', re.IGNORECASE
+)
+# Paths that are never articles
+_NON_ARTICLE_PATH_RE = re.compile('|'.join((
+    r'/search', r'/tag', r'/category', r'/archive', r'/about', r'/contact',
+    r'/privacy', r'/terms', r'/feed', r'/rss', r'/sitemap', r'/login',
+    r'/register', r'/signup', r'/logout', r'/admin', r'/dashboard',
+    r'/api/', r'/ajax/', r'/json', r'/xml', r'/robots\.txt',
+    r'/favicon', r'/static/', r'/assets/', r'/media/', r'/images/',
+    r'/css/', r'/js/', r'/fonts/', r'\.(php|asp|jsp)$',
+    r'/comment', r'/reply', r'/share', r'/print', r'/email',
+    r'/subscribe', r'/unsubscribe', r'/newsletter',
+)), re.IGNORECASE)
+_ARTICLE_PATH_RE = re.compile(r'/(post|article|blog|news|story)/')
+_SUBSTACK_POST_RE = re.compile(r'/p/[^/]+')
+_SUBSTACK_ITEM_RE = re.compile(r'/i/\d+')
+_YEAR_PATH_RE = re.compile(r'/\d{4}/')
+_METADATA_LINE_RE = re.compile('|'.join((
+    r'^\d{1,2}/\d{1,2}/\d{4}',  # Dates
+    r'^(published|updated|posted|by):?\s*',  # Metadata labels
+    r'^(tags?|categories?|filed under):?\s*',  # Classification
+    r'^share\s*(this|on)',  # Social sharing
+    r'^(read more|continue reading)',  # Navigation
+    r'^\d+\s*(comments?|replies?)',  # Comment counts
+)))
 
 
 class ZenRowsIntegration:
@@ -23,7 +130,8 @@ class ZenRowsIntegration:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.zenrows.com/v1/"
-        self.session = requests.Session()
+        # Pooled and retrying, so a transient API error doesn't cost the fallback
+        self.session = create_session()
     
     def scrape_with_zenrows(self, url: str, use_premium: bool = False) -> Optional[BeautifulSoup]:
         """Scrape URL using ZenRows API."""
@@ -42,7 +150,7 @@ class ZenRowsIntegration:
             response.raise_for_status()
             
             if response.status_code == 200 and response.content:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, HTML_PARSER)
                 print(f"    ✅ ZenRows successfully fetched content")
                 return soup
             else:
@@ -54,6 +162,19 @@ class ZenRowsIntegration:
             return None
 
 
+def _page_hrefs(content: bytes) -> List[str]:
+    """Return the href of every link on a page, in document order."""
+    if _HREF_XPATH is None:
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=_LINK_STRAINER)
+        return [link['href'] for link in soup.find_all('a', href=True)]
+    
+    # Honour the page's declared charset like bs4 does; lxml alone would read
+    # undeclared UTF-8 as Latin-1
+    encoding = EncodingDetector.find_declared_encoding(content, is_html=True) or 'utf-8'
+    tree = lxml_html.fromstring(content, parser=lxml_html.HTMLParser(encoding=encoding))
+    return [str(href) for href in _HREF_XPATH(tree)]
+
+
 class ContentDetector:
     """Detects main content areas using heuristic analysis."""
     
@@ -62,6 +183,9 @@ class ContentDetector:
             'article', 'main', '[role="main"]', '.content', '.post-content',
             '.article-content', '.blog-content', '.entry-content', '.post-body'
         ]
+        # Each indicator on its own, plus all of them grouped for a single tree walk
+        self._indicator_patterns = [soupsieve.compile(selector) for selector in self.content_indicators]
+        self._indicator_group = soupsieve.compile(', '.join(self.content_indicators))
         
         self.exclude_tags = {'nav', 'footer', 'header', 'aside', 'script', 'style', 'noscript'}
         self.exclude_classes = {
@@ -74,31 +198,50 @@ class ContentDetector:
     def find_main_content_area(self, soup: BeautifulSoup) -> Optional[Tag]:
         """Find the main content area using multiple heuristics."""
         candidates = []
+        # The same element is often a candidate of several methods, so score it
+        # and materialize its text once
+        scores = {}
+        text_lengths = {}
+        
+        def text_length_of(element: Tag) -> int:
+            key = id(element)
+            if key not in text_lengths:
+                text_lengths[key] = len(element.get_text(strip=True))
+            return text_lengths[key]
+        
+        def score_of(element: Tag) -> float:
+            key = id(element)
+            if key not in scores:
+                scores[key] = self._score_content_area(element, text_length_of(element))
+            return scores[key]
         
         # Method 1: Look for semantic HTML5 elements
-        for selector in self.content_indicators:
-            elements = soup.select(selector)
-            for element in elements:
-                score = self._score_content_area(element)
-                if score > 0:
-                    candidates.append((element, score, 'semantic'))
+        # One walk finds every indicator's matches; grouping them back per
+        # indicator keeps the candidate order of one select per indicator
+        semantic_elements = self._indicator_group.select(soup)
+        for pattern in self._indicator_patterns:
+            for element in semantic_elements:
+                if pattern.match(element):
+                    score = score_of(element)
+                    if score > 0:
+                        candidates.append((element, score, 'semantic'))
         
         # Method 2: Find areas with highest text density
-        all_containers = soup.find_all(['div', 'section', 'article'])
-        for container in all_containers:
-            if self._is_likely_content_container(container):
-                score = self._score_content_area(container)
+        # Method 3: Look for containers with multiple paragraphs
+        # Both scan the same containers, so one loop collects both (Method 3 ranks after Method 2)
+        paragraph_candidates = []
+        for container in soup.find_all(['div', 'section', 'article']):
+            if self._is_likely_content_container(container, text_length_of):
+                score = score_of(container)
                 if score > 0:
                     candidates.append((container, score, 'density'))
-        
-        # Method 3: Look for containers with multiple paragraphs
-        paragraph_containers = []
-        for container in all_containers:
-            paragraphs = container.find_all('p', recursive=True)
-            if len(paragraphs) >= 3:  # At least 3 paragraphs
-                score = self._score_content_area(container)
+            
+            # At least 3 paragraphs; the search stops at the third
+            if len(container.find_all('p', limit=3)) >= 3:
+                score = score_of(container)
                 if score > 0:
-                    candidates.append((container, score, 'paragraphs'))
+                    paragraph_candidates.append((container, score, 'paragraphs'))
+        candidates.extend(paragraph_candidates)
         
         if not candidates:
             return None
@@ -109,7 +252,7 @@ class ContentDetector:
         
         return best_candidate[0]
     
-    def _score_content_area(self, element: Tag) -> float:
+    def _score_content_area(self, element: Tag, text_length: Optional[int] = None) -> float:
         """Score a potential content area based on various heuristics."""
         if not element:
             return 0
@@ -117,29 +260,32 @@ class ContentDetector:
         score = 0
         
         # Text content length (primary indicator)
-        text_content = element.get_text(strip=True)
-        text_length = len(text_content)
+        if text_length is None:
+            text_length = len(element.get_text(strip=True))
         score += min(text_length / 100, 50)  # Cap at 50 points
         
+        # Paragraphs, headings, lists and links are all counted in one walk of the subtree
+        tag_counts = Counter(tag.name for tag in element.find_all(_SCORED_TAGS))
+        
         # Number of paragraphs
-        paragraphs = element.find_all('p')
-        score += len(paragraphs) * 2
+        paragraphs = tag_counts['p']
+        score += paragraphs * 2
         
         # Presence of headings
-        headings = element.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        score += len(headings) * 3
+        headings = sum(tag_counts[heading] for heading in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+        score += headings * 3
         
         # Lists (often contain structured content)
-        lists = element.find_all(['ul', 'ol'])
-        score += len(lists) * 1.5
+        lists = tag_counts['ul'] + tag_counts['ol']
+        score += lists * 1.5
         
         # Penalize if it's likely navigation or sidebar
         if self._is_likely_navigation(element):
             score -= 20
         
         # Penalize if it contains mostly links
-        links = element.find_all('a')
-        if len(links) > len(paragraphs) and len(links) > 5:
+        links = tag_counts['a']
+        if links > paragraphs and links > 5:
             score -= 10
         
         # Bonus for semantic HTML5 elements
@@ -149,42 +295,50 @@ class ContentDetector:
         # Bonus for content-related class names
         class_names = element.get('class', [])
         for class_name in class_names:
-            if any(content_word in class_name.lower() 
+            class_lower = class_name.lower()
+            if any(content_word in class_lower
                    for content_word in ['content', 'post', 'article', 'blog', 'entry']):
                 score += 5
                 break
         
         return max(score, 0)
     
-    def _is_likely_content_container(self, element: Tag) -> bool:
-        """Check if element is likely to contain main content."""
+    def _is_likely_content_container(self, element: Tag, text_length_of=None) -> bool:
+        """
+        Check if element is likely to contain main content.
+        
+        text_length_of, if given, returns the element's stripped text length
+        from a cache shared with the scoring pass.
+        """
         if element.name in self.exclude_tags:
             return False
         
         class_names = element.get('class', [])
         for class_name in class_names:
-            if any(exclude_word in class_name.lower() for exclude_word in self.exclude_classes):
+            class_lower = class_name.lower()
+            if any(exclude_word in class_lower for exclude_word in self.exclude_classes):
                 return False
         
         # Must have substantial text content
-        text_length = len(element.get_text(strip=True))
-        return text_length > 100
+        if text_length_of is not None:
+            return text_length_of(element) > 100
+        return len(element.get_text(strip=True)) > 100
     
     def _is_likely_navigation(self, element: Tag) -> bool:
         """Check if element is likely navigation."""
-        class_names = element.get('class', [])
+        class_names = [class_name.lower() for class_name in element.get('class', [])]
         id_name = element.get('id', '').lower()
         
         nav_indicators = ['nav', 'menu', 'navigation', 'sidebar', 'breadcrumb']
         
         for indicator in nav_indicators:
-            if (any(indicator in class_name.lower() for class_name in class_names) or
+            if (any(indicator in class_name for class_name in class_names) or
                 indicator in id_name):
                 return True
         
         # Check if it's mostly links
         links = element.find_all('a')
-        text_elements = element.find_all(text=True)
+        text_elements = element.find_all(string=True)
         non_empty_text = [t.strip() for t in text_elements if t.strip()]
         
         if len(links) > 0 and len(non_empty_text) > 0:
@@ -198,14 +352,23 @@ class UniversalScraper:
     """Universal scraper that adapts to different website structures."""
     
     def __init__(self, headers: Optional[Dict[str, str]] = None, timeout: int = 15, 
-                 zenrows_api_key: Optional[str] = None):
+                 zenrows_api_key: Optional[str] = None, session: Optional[requests.Session] = None,
+                 request_delay: float = 0.2, verbose: bool = True, async_fetch: bool = False):
         self.headers = headers or {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.timeout = timeout
+        # Per-page progress lines; warnings and errors are always printed
+        self.verbose = verbose
+        # Batches go through httpx only on request: that path skips the session's
+        # pooled connections and Retry adapter
+        self.async_fetch = async_fetch
         self.content_detector = ContentDetector()
-        self.session = requests.Session()
+        # A shared session lets every target in a run reuse the same connection pool
+        self.session = session if session is not None else create_session()
         self.session.headers.update(self.headers)
+        # Space out request starts per host instead of pausing between finished results
+        self.rate_limiter = HostRateLimiter(request_delay)
         
         # Initialize ZenRows if API key provided
         self.zenrows = None
@@ -215,33 +378,64 @@ class UniversalScraper:
     
     def scrape_url(self, url: str) -> Optional[Dict[str, Any]]:
         """Scrape a single URL using dynamic content detection."""
-        print(f"  🔍 Scraping: {url}")
-        
-        soup = None
+        if self.verbose:
+            print(f"  🔍 Scraping: {url}")
         
         # Try regular scraping first
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(self.fetch(url), HTML_PARSER)
             
         except requests.exceptions.RequestException as e:
-            print(f"    ⚠️  Network error: {e}")
-            
-            # Try ZenRows fallback if available
-            if self.zenrows:
-                print(f"    🚀 Attempting ZenRows fallback...")
-                soup = self.zenrows.scrape_with_zenrows(url, use_premium=True)
+            soup = self._fallback_for_network_error(url, e)
+            if not soup:
+                return None
+                
+        except Exception as e:
+            print(f"    ❌ Processing error: {e}")
+            return None
+        
+        return self._process_page(url, soup)
+    
+    def fetch(self, url: str, timeout: Optional[float] = None) -> bytes:
+        """Fetch a page's body once the rate limiter allows a request to its host."""
+        self.rate_limiter.wait(url)
+        return fetch_page(self.session, url, self.timeout if timeout is None else timeout)
+    
+    async def _scrape_url_async(self, client, url: str) -> Optional[Dict[str, Any]]:
+        """Scrape a single URL with an httpx.AsyncClient, parsing off the event loop."""
+        if self.verbose:
+            print(f"  🔍 Scraping: {url}")
+        
+        try:
+            html = await fetch_page_async(client, url)
+            soup = await asyncio.to_thread(BeautifulSoup, html, HTML_PARSER)
             
+        except httpx.HTTPError as e:
+            soup = await asyncio.to_thread(self._fallback_for_network_error, url, e)
             if not soup:
-                print(f"    ❌ All scraping methods failed")
                 return None
                 
         except Exception as e:
             print(f"    ❌ Processing error: {e}")
             return None
         
-        # Process the scraped content
+        return await asyncio.to_thread(self._process_page, url, soup)
+    
+    def _fallback_for_network_error(self, url: str, error: Exception) -> Optional[BeautifulSoup]:
+        """Retry a page that couldn't be fetched through ZenRows, if it's enabled."""
+        print(f"    ⚠️  Network error: {error}")
+        
+        soup = None
+        if self.zenrows:
+            print(f"    🚀 Attempting ZenRows fallback...")
+            soup = self.zenrows.scrape_with_zenrows(url, use_premium=True)
+        
+        if not soup:
+            print(f"    ❌ All scraping methods failed")
+        return soup
+    
+    def _process_page(self, url: str, soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+        """Turn a parsed page into a scraped item, retrying through ZenRows if it has no content."""
         try:
             # Extract title using multiple strategies
             title = self._extract_title(soup)
@@ -280,10 +474,10 @@ class UniversalScraper:
             
             # Extract author using multiple strategies with improved validation
             author = self._extract_author(soup, url, title, content)
-            if author:
-                print(f"    👤 Author found: {author}")
-            
-            print(f"    ✅ '{title}' ({len(content)} chars)")
+            if self.verbose:
+                if author:
+                    print(f"    👤 Author found: {author}")
+                print(f"    ✅ '{title}' ({len(content)} chars)")
             
             return {
                 "title": title,
@@ -303,9 +497,7 @@ class UniversalScraper:
         
         try:
             # Try regular scraping first
-            response = self.session.get(base_url, timeout=self.timeout)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(self.fetch(base_url), HTML_PARSER)
             
         except requests.exceptions.RequestException as e:
             print(f"    ⚠️  Network error: {e}")
@@ -380,7 +572,7 @@ class UniversalScraper:
         if title_tag:
             title = title_tag.get_text(strip=True)
             # Clean up common title suffixes
-            title = re.sub(r'\s*[\|\-\–]\s*[^|]*$', '', title)
+            title = _TITLE_SUFFIX_RE.sub('', title)
             if len(title) > 5:
                 return title
         
@@ -388,16 +580,15 @@ class UniversalScraper:
         h1_tags = soup.find_all('h1')
         if h1_tags:
             # Filter out h1s that are likely navigation or site titles
-            content_h1s = []
+            content_h1_texts = []
             for h1 in h1_tags:
                 text = h1.get_text(strip=True)
                 if len(text) > 10 and not self._is_likely_site_title(h1, text):
-                    content_h1s.append(h1)
+                    content_h1_texts.append(text)
             
-            if content_h1s:
+            if content_h1_texts:
                 # Choose the h1 with the most text
-                best_h1 = max(content_h1s, key=lambda h: len(h.get_text(strip=True)))
-                title = best_h1.get_text(strip=True)
+                title = max(content_h1_texts, key=len)
                 if len(title) > 5:
                     return title
         
@@ -414,16 +605,7 @@ class UniversalScraper:
             return True
         
         # Check if it contains common site title patterns
-        site_patterns = [
-            r'^(home|blog|news|articles?)$',
-            r'^[a-z]+\.(com|io|org|net)$',
-        ]
-        
-        for pattern in site_patterns:
-            if re.search(pattern, text.lower()):
-                return True
-        
-        return False
+        return _SITE_TITLE_RE.search(text.lower()) is not None
     
     def _extract_content_from_area(self, content_area: Tag) -> str:
         """Extract and format content from the identified content area."""
@@ -431,6 +613,10 @@ class UniversalScraper:
         
         # Get all relevant elements in order
         for element in content_area.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li', 'blockquote']):
+            # Lists are emitted through their li elements, so don't materialize their text
+            if element.name in ['ul', 'ol']:
+                continue
+            
             text = element.get_text(strip=True)
             
             if not text or len(text) < 10:
@@ -449,9 +635,6 @@ class UniversalScraper:
                 if element.parent and element.parent.name in ['ul', 'ol']:
                     # Check if we haven't processed this list yet
                     content_parts.append(f"• {text}")
-            elif element.name in ['ul', 'ol']:
-                # Skip - we'll handle individual li elements
-                continue
             elif element.name == 'blockquote':
                 content_parts.append(f"> {text}")
             else:
@@ -576,19 +759,19 @@ class UniversalScraper:
             return False
         
         # Must contain letters
-        if not re.search(r'[A-Za-z]', name):
+        if not _HAS_LETTER_RE.search(name):
             return False
         
         # Reject if it's mostly technical punctuation
-        if len(re.sub(r'[A-Za-z\s\.\-\']', '', name)) > len(name) * 0.5:
+        if len(_ASCII_NAME_CHARS_RE.sub('', name)) > len(name) * 0.5:
             return False
         
         # Should look like a name pattern (letters, spaces, common punctuation)
-        if not re.match(r'^[A-Za-z\s\.\-\'\u00C0-\u017F]+$', name):
+        if not _NAME_RE.match(name):
             return False
         
         # Should have at least one capital letter
-        if not re.search(r'[A-Z]', name):
+        if not _HAS_UPPERCASE_RE.search(name):
             return False
         
         return True
@@ -666,20 +849,8 @@ class UniversalScraper:
             return False
         
         # 3. Reject if it matches common metadata patterns
-        metadata_patterns = [
-            r'^(published|updated|posted|edited|created|modified)',
-            r'^(tags?|categories?|topics?)',
-            r'^(share|follow|subscribe|comments?)',
-            r'^\d+\s+(min|hour|day|week|month|year)s?\s+(ago|read)',
-            r'^(january|february|march|april|may|june|july|august|september|october|november|december)',
-            r'^\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4}',
-            r'^(mon|tue|wed|thu|fri|sat|sun)',
-            r'every month', r'monthly', r'weekly', r'daily'
-        ]
-        
-        for pattern in metadata_patterns:
-            if re.search(pattern, author_lower):
-                return False
+        if _AUTHOR_METADATA_RE.search(author_lower):
+            return False
         
         # 4. Reject if it's a generic role or department
         generic_roles = [
@@ -694,8 +865,8 @@ class UniversalScraper:
         
         # 5. Reject if it's suspiciously related to the content topic
         # Check if author name contains keywords that also appear prominently in title/content
-        author_words = set(re.findall(r'\b\w+\b', author_lower))
-        title_words = set(re.findall(r'\b\w+\b', title_lower)) if title_lower else set()
+        author_words = set(_WORD_RE.findall(author_lower))
+        title_words = set(_WORD_RE.findall(title_lower)) if title_lower else set()
         
         # If more than 50% of author words appear in title, it's suspicious
         if title_words and len(author_words.intersection(title_words)) > len(author_words) * 0.5:
@@ -731,7 +902,8 @@ class UniversalScraper:
         # If it appears only once, be extra cautious
         if author_mentions == 1:
             # Check if it's in a questionable context
-            if author_context and any(tech_term in author_context.lower() for tech_term in [
+            # context_lower was set in step 6 whenever there is a context
+            if author_context and any(tech_term in context_lower for tech_term in [
                 'algorithm', 'data structure', 'coding', 'programming', 'interview',
                 'leetcode', 'hackerrank', 'complexity', 'optimization'
             ]):
@@ -747,11 +919,11 @@ class UniversalScraper:
         name = name.strip()
         
         # Must contain only name-appropriate characters
-        if not re.match(r'^[A-Za-z\s\.\-\'\u00C0-\u017F]+$', name):
+        if not _NAME_RE.match(name):
             return False
         
         # Must have at least one capital letter (proper noun)
-        if not re.search(r'[A-Z]', name):
+        if not _HAS_UPPERCASE_RE.search(name):
             return False
         
         # Check word structure
@@ -850,21 +1022,12 @@ class UniversalScraper:
     
     def _extract_author_by_improved_pattern(self, soup: BeautifulSoup) -> str:
         """Extract author using improved text patterns."""
-        # More comprehensive patterns
-        patterns = [
-            r'By\s+([A-Za-z\s\.\-\'\u00C0-\u017F]+?)(?:\s*[\|\,\n\r\•]|\s*on\s|\s*\d{1,2}[\/\-]\d{1,2}|$)',
-            r'Written by\s+([A-Za-z\s\.\-\'\u00C0-\u017F]+?)(?:\s*[\|\,\n\r\•]|\s*on\s|\s*\d{1,2}[\/\-]\d{1,2}|$)',
-            r'Author:\s*([A-Za-z\s\.\-\'\u00C0-\u017F]+?)(?:\s*[\|\,\n\r\•]|\s*\d{1,2}[\/\-]\d{1,2}|$)',
-            r'Posted by\s+([A-Za-z\s\.\-\'\u00C0-\u017F]+?)(?:\s*[\|\,\n\r\•]|\s*on\s|\s*\d{1,2}[\/\-]\d{1,2}|$)',
-            r'Published by\s+([A-Za-z\s\.\-\'\u00C0-\u017F]+?)(?:\s*[\|\,\n\r\•]|\s*on\s|\s*\d{1,2}[\/\-]\d{1,2}|$)',
-        ]
+        # The page text is the same for every pattern, so extract it once
+        all_text = soup.get_text()
         
         # Search in text content more broadly
-        for pattern in patterns:
-            compiled_pattern = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-            
+        for compiled_pattern in _BYLINE_PATTERNS:
             # Search in all text nodes
-            all_text = soup.get_text()
             match = compiled_pattern.search(all_text)
             if match:
                 author_name = match.group(1).strip()
@@ -893,16 +1056,15 @@ class UniversalScraper:
         for area in header_areas:
             # Look for author information in these areas
             author_elements = area.find_all(['span', 'div', 'p', 'a'], 
-                                          string=re.compile(r'(by|author)', re.IGNORECASE))
+                                          string=_BY_OR_AUTHOR_RE)
             
             for element in author_elements[:3]:  # Limit to first few matches
                 parent = element.parent if element.parent else element
                 text = parent.get_text(strip=True)
                 
                 # Extract author from the text
-                for pattern in [r'by\s+([A-Za-z\s\.\-\'\u00C0-\u017F]+)', 
-                              r'author[:\s]+([A-Za-z\s\.\-\'\u00C0-\u017F]+)']:
-                    match = re.search(pattern, text, re.IGNORECASE)
+                for pattern in _HEADER_AUTHOR_PATTERNS:
+                    match = pattern.search(text)
                     if match:
                         author_name = match.group(1).strip()
                         if self._is_reasonable_author(author_name):
@@ -913,7 +1075,7 @@ class UniversalScraper:
     def _extract_author_from_credits(self, soup: BeautifulSoup) -> str:
         """Extract author from Credits section (interviewing.io style)."""
         # Look for Credits heading
-        credits_headings = soup.find_all(['h4', 'h5', 'h6'], string=re.compile(r'credits', re.IGNORECASE))
+        credits_headings = soup.find_all(['h4', 'h5', 'h6'], string=_CREDITS_RE)
         
         for heading in credits_headings:
             # Find the container that holds the credits information
@@ -922,21 +1084,10 @@ class UniversalScraper:
                 continue
             
             # Look for author-related labels in order of preference
-            author_labels = [
-                'creator and author',
-                'author and creator', 
-                'creator & author',
-                'author & creator',
-                'author',
-                'creator',
-                'written by',
-                'by'
-            ]
-            
-            for label in author_labels:
+            for label in _CREDIT_AUTHOR_LABELS:
                 # Find elements containing the label
                 label_elements = credits_container.find_all(['h6', 'h5', 'h4', 'div', 'span'], 
-                                                          string=re.compile(label, re.IGNORECASE))
+                                                          string=label)
                 
                 for label_element in label_elements:
                     # Look for the author name in the next sibling or child elements
@@ -1012,12 +1163,12 @@ class UniversalScraper:
                 return title_attr.strip()
         
         # Clean prefixes and suffixes
-        text = re.sub(r'^(by|author:?|written by|posted by|published by)\s*', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s*[\|\-\–]\s*.*$', '', text)  # Remove everything after | or -
-        text = re.sub(r'\s*on\s+\d{1,2}[\/\-]\d{1,2}.*$', '', text, flags=re.IGNORECASE)  # Remove dates
+        text = _AUTHOR_PREFIX_RE.sub('', text)
+        text = _AUTHOR_SUFFIX_RE.sub('', text)  # Remove everything after | or -
+        text = _AUTHOR_DATE_SUFFIX_RE.sub('', text)  # Remove dates
         
         # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         # Use the reasonable validation
         if self._is_reasonable_author(text):
@@ -1068,17 +1219,17 @@ class UniversalScraper:
             return False
         
         # Must contain at least some letters
-        if not re.search(r'[A-Za-z]', name):
+        if not _HAS_LETTER_RE.search(name):
             return False
         
         # Shouldn't be mostly numbers or symbols
-        if len(re.sub(r'[A-Za-z\s\.\-\'\u00C0-\u017F]', '', name)) > len(name) * 0.3:
+        if len(_NAME_CHARS_RE.sub('', name)) > len(name) * 0.3:
             return False
         
         # Should look like a name pattern
-        if re.match(r'^[A-Za-z\s\.\-\'\u00C0-\u017F]+$', name):
+        if _NAME_RE.match(name):
             # Name should have at least one capital letter (proper noun)
-            if not re.search(r'[A-Z]', name):
+            if not _HAS_UPPERCASE_RE.search(name):
                 return False
             
             # Should be either multiple words or a reasonable single name
@@ -1098,7 +1249,7 @@ class UniversalScraper:
         import re
         pattern = re.compile(re.escape(author_name), re.IGNORECASE)
         
-        for element in soup.find_all(text=pattern):
+        for element in soup.find_all(string=pattern):
             if hasattr(element, 'parent') and element.parent:
                 context = element.parent.get_text(strip=True)
                 if len(context) < 200:  # Get broader context if too short
@@ -1116,24 +1267,12 @@ class UniversalScraper:
             return False
         
         # Skip common non-article extensions
-        if re.search(r'\.(jpg|jpeg|png|gif|pdf|doc|docx|zip|mp3|mp4|css|js|ico|svg|woff|ttf)$', href, re.IGNORECASE):
+        if _ASSET_EXTENSION_RE.search(href):
             return False
         
         # Skip common non-article paths (expanded list)
-        skip_patterns = [
-            r'/search', r'/tag', r'/category', r'/archive', r'/about', r'/contact',
-            r'/privacy', r'/terms', r'/feed', r'/rss', r'/sitemap', r'/login',
-            r'/register', r'/signup', r'/logout', r'/admin', r'/dashboard',
-            r'/api/', r'/ajax/', r'/json', r'/xml', r'/robots\.txt',
-            r'/favicon', r'/static/', r'/assets/', r'/media/', r'/images/',
-            r'/css/', r'/js/', r'/fonts/', r'\.(php|asp|jsp)$',
-            r'/comment', r'/reply', r'/share', r'/print', r'/email',
-            r'/subscribe', r'/unsubscribe', r'/newsletter'
-        ]
-        
-        for pattern in skip_patterns:
-            if re.search(pattern, href, re.IGNORECASE):
-                return False
+        if _NON_ARTICLE_PATH_RE.search(href):
+            return False
         
         # Skip if it's an external link (different domain)
         if href.startswith('http') and base_url:
@@ -1159,24 +1298,24 @@ class UniversalScraper:
             score += 3
         
         # URL structure analysis
-        if re.search(r'/(post|article|blog|news|story)/', href):
+        if _ARTICLE_PATH_RE.search(href):
             score += 10
         
         # Substack-specific patterns
-        if re.search(r'/p/[^/]+', href):  # Substack post pattern
+        if _SUBSTACK_POST_RE.search(href):  # Substack post pattern
             score += 15
         
-        if re.search(r'/i/\d+', href):  # Substack item pattern
+        if _SUBSTACK_ITEM_RE.search(href):  # Substack item pattern
             score += 12
         
-        if re.search(r'/\d{4}/', href):  # Likely date-based URL
+        if _YEAR_PATH_RE.search(href):  # Likely date-based URL
             score += 5
         
         # Parent element analysis
         parent = link_element.parent
         if parent:
-            parent_class = ' '.join(parent.get('class', []))
-            if any(indicator in parent_class.lower() 
+            parent_class = ' '.join(parent.get('class', [])).lower()
+            if any(indicator in parent_class
                    for indicator in ['post', 'article', 'entry', 'story', 'pencraft', 'preview']):
                 score += 8
         
@@ -1192,21 +1331,7 @@ class UniversalScraper:
     
     def _is_likely_metadata(self, text: str) -> bool:
         """Check if text is likely metadata rather than content."""
-        metadata_patterns = [
-            r'^\d{1,2}/\d{1,2}/\d{4}',  # Dates
-            r'^(published|updated|posted|by):?\s*',  # Metadata labels
-            r'^(tags?|categories?|filed under):?\s*',  # Classification
-            r'^share\s*(this|on)',  # Social sharing
-            r'^(read more|continue reading)',  # Navigation
-            r'^\d+\s*(comments?|replies?)',  # Comment counts
-        ]
-        
-        text_lower = text.lower()
-        for pattern in metadata_patterns:
-            if re.search(pattern, text_lower):
-                return True
-        
-        return False
+        return _METADATA_LINE_RE.search(text.lower()) is not None
 
     def _extract_author_from_footer(self, soup: BeautifulSoup) -> str:
         """Extract author from footer or sidebar areas - removed as too unreliable."""
@@ -1215,6 +1340,16 @@ class UniversalScraper:
     
     def scrape_multiple_urls(self, urls: List[str], max_workers: int = 3) -> List[Dict[str, Any]]:
         """Scrape multiple URLs in parallel."""
+        # Links gathered from several sections of an index often repeat (sometimes
+        # differing only by #fragment, which is never sent); fetch each page once
+        unique_urls = {}
+        for url in urls:
+            unique_urls.setdefault(urldefrag(url).url, url)
+        urls = list(unique_urls.values())
+        
+        if self.async_fetch and httpx is not None:
+            return asyncio.run(self._scrape_multiple_urls_async(urls, max_workers))
+        
         items = []
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -1228,17 +1363,44 @@ class UniversalScraper:
                 except Exception as exc:
                     url = future_to_url[future]
                     print(f"  ❌ Error scraping {url}: {exc}")
-                
-                # Rate limiting
-                time.sleep(0.2)
         
         return items
+    
+    async def _scrape_multiple_urls_async(self, urls: List[str], max_workers: int) -> List[Dict[str, Any]]:
+        """Scrape multiple URLs concurrently on one event loop with httpx."""
+        semaphore = asyncio.Semaphore(max_workers)
+        limits = httpx.Limits(
+            max_connections=max(max_workers * 2, 10),
+            max_keepalive_connections=max(max_workers, 10)
+        )
+        
+        async with httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            headers=dict(self.session.headers),
+            timeout=self.timeout,
+            limits=limits,
+            follow_redirects=True
+        ) as client:
+            async def scrape(url: str) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    await asyncio.sleep(self.rate_limiter.reserve(url))
+                    return await self._scrape_url_async(client, url)
+            
+            results = await asyncio.gather(*(scrape(url) for url in urls), return_exceptions=True)
+        
+        items = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                print(f"  ❌ Error scraping {url}: {result}")
+            elif result:
+                items.append(result)
+        return items
 
 
 class ComprehensiveScraper:
     """Orchestrates comprehensive scraping of all required sources."""
     
-    def __init__(self, zenrows_api_key: Optional[str] = None):
+    def __init__(self, zenrows_api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         # Initialize ZenRows with API key from config if not provided
         if not zenrows_api_key:
             try:
@@ -1251,7 +1413,10 @@ class ComprehensiveScraper:
             except Exception as e:
                 print(f"⚠️  Error loading ZenRows API key from config: {e}")
         
-        self.scraper = UniversalScraper(zenrows_api_key=zenrows_api_key)
+        # Six sources are crawled concurrently with three URL workers each
+        if session is None:
+            session = create_session(max_workers=18)
+        self.scraper = UniversalScraper(zenrows_api_key=zenrows_api_key, session=session)
         self.all_items = []
         
         # Define all required sources
@@ -1284,54 +1449,60 @@ class ComprehensiveScraper:
         """Scrape all sources mentioned in the original requirements."""
         print("🚀 Starting comprehensive scraping of all required sources...")
         
-        # 1. Scrape interviewing.io blog posts
-        print("\n📰 Scraping interviewing.io blog posts...")
-        blog_items = self._scrape_interviewing_io_blog()
-        self.all_items.extend(blog_items)
-        print(f"   ✅ Scraped {len(blog_items)} blog posts")
-        
-        # 2. Scrape company guides (the missing content!)
-        print("\n🏢 Scraping company interview guides...")
-        company_items = self._scrape_company_guides()
-        self.all_items.extend(company_items)
-        print(f"   ✅ Scraped {len(company_items)} company guides")
-        
-        # 3. Scrape interview guides from learn section
-        print("\n📚 Scraping interview guides...")
-        guide_items = self._scrape_interview_guides()
-        self.all_items.extend(guide_items)
-        print(f"   ✅ Scraped {len(guide_items)} interview guides")
-        
-        # 4. Scrape Nil's DS&A blog posts
-        print("\n🧮 Scraping Nil's DS&A blog posts...")
-        nil_items = self._scrape_nil_dsa_blog()
-        self.all_items.extend(nil_items)
-        print(f"   ✅ Scraped {len(nil_items)} DS&A posts")
-        
-        # 5. Scrape Shreycation Substack
-        print("\n📰 Scraping Shreycation Substack...")
-        substack_items = self._scrape_shreycation_substack()
-        self.all_items.extend(substack_items)
-        print(f"   ✅ Scraped {len(substack_items)} Substack posts")
-        
-        # 6. Discover and scrape additional interviewing.io content
-        print("\n🔍 Discovering additional interviewing.io content...")
-        additional_items = self._discover_additional_content()
-        self.all_items.extend(additional_items)
-        print(f"   ✅ Scraped {len(additional_items)} additional items")
+        # (heading, what was scraped, scraping method) per source, in output order
+        sources = [
+            ("📰 Scraping interviewing.io blog posts...", "blog posts", self._scrape_interviewing_io_blog),
+            ("🏢 Scraping company interview guides...", "company guides", self._scrape_company_guides),
+            ("📚 Scraping interview guides...", "interview guides", self._scrape_interview_guides),
+            ("🧮 Scraping Nil's DS&A blog posts...", "DS&A posts", self._scrape_nil_dsa_blog),
+            ("📰 Scraping Shreycation Substack...", "Substack posts", self._scrape_shreycation_substack),
+            ("🔍 Discovering additional interviewing.io content...", "additional items", self._discover_additional_content),
+        ]
+        
+        # Sources are independent and network-bound, so crawl them all at once.
+        # Each source is reported as it finishes, but results are still
+        # collected in the order above.
+        items_by_source = [[] for _ in sources]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            future_to_index = {
+                executor.submit(scrape_source): i
+                for i, (_, _, scrape_source) in enumerate(sources)
+            }
+            for future in concurrent.futures.as_completed(future_to_index):
+                index = future_to_index[future]
+                heading, label, _ = sources[index]
+                print(f"\n{heading}")
+                try:
+                    items = future.result()
+                except Exception as e:
+                    # One failing source shouldn't discard what the others collected
+                    print(f"   ❌ Failed to scrape {label}: {e}")
+                    continue
+                items_by_source[index] = items
+                print(f"   ✅ Scraped {len(items)} {label}")
+        
+        for items in items_by_source:
+            self.all_items.extend(items)
+        
+        # The same article is often reachable from several sources
+        scraped_count = len(self.all_items)
+        self.all_items = dedupe_items(self.all_items)
+        if len(self.all_items) < scraped_count:
+            print(f"   🧹 Dropped {scraped_count - len(self.all_items)} duplicate items")
         
         print(f"\n🎉 Total items scraped: {len(self.all_items)}")
         return self.all_items
     
     def _scrape_interviewing_io_blog(self) -> List[Dict[str, Any]]:
         """Scrape all blog posts from interviewing.io."""
-        blog_urls = self._discover_blog_urls('https://interviewing.io/blog')
-        
-        # Add pagination to get more blog posts
-        for page in range(2, 6):  # Check first few pages
-            page_url = f'https://interviewing.io/blog?page={page}'
-            page_urls = self._discover_blog_urls(page_url)
-            blog_urls.extend(page_urls)
+        # The first few index pages are independent fetches, so request them together
+        index_urls = ['https://interviewing.io/blog'] + [
+            f'https://interviewing.io/blog?page={page}' for page in range(2, 6)
+        ]
+        blog_urls = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(index_urls)) as executor:
+            for page_urls in executor.map(self._discover_blog_urls, index_urls):
+                blog_urls.extend(page_urls)
         
         # Remove duplicates
         blog_urls = list(set(blog_urls))
@@ -1347,7 +1518,8 @@ class ComprehensiveScraper:
         items = self.scraper.scrape_multiple_urls(self.company_guide_urls)
         
         # Discover additional company guides
-        topics_page_urls = self._discover_from_topics_page()
+        topics_page_urls = [url for url in self._discover_from_topics_page()
+                            if url not in self.company_guide_urls]
         if topics_page_urls:
             print(f"   🔍 Found {len(topics_page_urls)} additional company URLs")
             additional_items = self.scraper.scrape_multiple_urls(topics_page_urls)
@@ -1361,7 +1533,8 @@ class ComprehensiveScraper:
         items = self.scraper.scrape_multiple_urls(self.interview_guide_urls)
         
         # Discover additional guides from the learn page
-        learn_urls = self._discover_from_learn_page()
+        learn_urls = [url for url in self._discover_from_learn_page()
+                      if url not in self.interview_guide_urls]
         if learn_urls:
             print(f"   📖 Found {len(learn_urls)} additional guide URLs")
             additional_items = self.scraper.scrape_multiple_urls(learn_urls)
@@ -1426,9 +1599,7 @@ class ComprehensiveScraper:
     def _discover_blog_urls(self, blog_url: str) -> List[str]:
         """Discover blog post URLs from the blog index page."""
         try:
-            response = self.scraper.session.get(blog_url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(self.scraper.fetch(blog_url, 15), HTML_PARSER)
             
             # Look for blog post links using multiple strategies
             post_urls = set()
@@ -1466,18 +1637,15 @@ class ComprehensiveScraper:
     def _discover_from_topics_page(self) -> List[str]:
         """Discover company guide URLs from the topics page."""
         try:
-            response = self.scraper.session.get('https://interviewing.io/topics', timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            content = self.scraper.fetch('https://interviewing.io/topics', 15)
             
             company_urls = set()
             
             # Look for company-related links
-            all_links = soup.find_all('a', href=True)
-            for link in all_links:
-                href = link['href']
+            for href in _page_hrefs(content):
+                href_lower = href.lower()
                 # Look for hiring process or company-specific URLs
-                if any(pattern in href.lower() for pattern in [
+                if any(pattern in href_lower for pattern in [
                     '/guides/hiring-process/',
                     '/company/',
                     '/interview-process/',
@@ -1496,18 +1664,15 @@ class ComprehensiveScraper:
     def _discover_from_learn_page(self) -> List[str]:
         """Discover interview guide URLs from the learn page."""
         try:
-            response = self.scraper.session.get('https://interviewing.io/learn', timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            content = self.scraper.fetch('https://interviewing.io/learn', 15)
             
             guide_urls = set()
             
             # Look for guide-related links
-            all_links = soup.find_all('a', href=True)
-            for link in all_links:
-                href = link['href']
+            for href in _page_hrefs(content):
+                href_lower = href.lower()
                 # Look for guide URLs
-                if any(pattern in href.lower() for pattern in [
+                if any(pattern in href_lower for pattern in [
                     '/guides/',
                     '/guide-',
                     'interview-guide',
@@ -1530,6 +1695,7 @@ class ComprehensiveScraper:
         try:
             # Try the direct category URL first
             dsa_url = 'https://nilmamano.com/blog/category/dsa'
+            self.scraper.rate_limiter.wait(dsa_url)
             response = self.scraper.session.get(dsa_url, timeout=15)
             
             if response.status_code == 404:
@@ -1542,6 +1708,7 @@ class ComprehensiveScraper:
                 
                 for alt_url in alternative_urls:
                     try:
+                        self.scraper.rate_limiter.wait(alt_url)
                         response = self.scraper.session.get(alt_url, timeout=15)
                         if response.status_code == 200:
                             dsa_url = alt_url
@@ -1550,11 +1717,12 @@ class ComprehensiveScraper:
                         continue
                 else:
                     # If no category page works, try the main blog page
-                    response = self.scraper.session.get('https://nilmamano.com/blog/', timeout=15)
                     dsa_url = 'https://nilmamano.com/blog/'
+                    self.scraper.rate_limiter.wait(dsa_url)
+                    response = self.scraper.session.get(dsa_url, timeout=15)
             
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=_LINK_STRAINER)
             
             dsa_urls = set()
             
@@ -1562,6 +1730,7 @@ class ComprehensiveScraper:
             all_links = soup.find_all('a', href=True)
             for link in all_links:
                 href = link['href']
+                href_lower = href.lower()
                 link_text = link.get_text(strip=True).lower()
                 
                 # Check if it's likely a DS&A post
@@ -1569,7 +1738,7 @@ class ComprehensiveScraper:
                     'algorithm', 'data structure', 'leetcode', 'coding',
                     'binary search', 'dynamic programming', 'graph',
                     'tree', 'array', 'string', 'hash', 'sort'
-                ]) or any(keyword in href.lower() for keyword in [
+                ]) or any(keyword in href_lower for keyword in [
                     'algorithm', 'data-structure', 'leetcode', 'dsa'
                 ]):
                     full_url = urljoin(dsa_url, href)
@@ -1588,9 +1757,7 @@ class ComprehensiveScraper:
     def _discover_substack_urls(self, substack_url: str) -> List[str]:
         """Discover Substack post URLs with Substack-specific patterns."""
         try:
-            response = self.scraper.session.get(substack_url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(self.scraper.fetch(substack_url, 15), HTML_PARSER)
             
             substack_urls = set()
             
@@ -1602,7 +1769,7 @@ class ComprehensiveScraper:
                 # Substack posts typically have patterns like:
                 # - /p/post-title
                 # - /i/12345678/some-title  
-                if re.search(r'/p/[^/]+', href) or re.search(r'/i/\d+', href):
+                if _SUBSTACK_POST_RE.search(href) or _SUBSTACK_ITEM_RE.search(href):
                     full_url = urljoin(substack_url, href)
                     substack_urls.add(full_url)
                 
@@ -1633,15 +1800,12 @@ class ComprehensiveScraper:
         
         # Discover from main navigation or sitemap
         try:
-            response = self.scraper.session.get('https://interviewing.io', timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            content = self.scraper.fetch('https://interviewing.io', 15)
             
             # Look for navigation links to guides, resources, etc.
-            nav_links = soup.find_all('a', href=True)
-            for link in nav_links:
-                href = link['href']
-                if any(pattern in href.lower() for pattern in [
+            for href in _page_hrefs(content):
+                href_lower = href.lower()
+                if any(pattern in href_lower for pattern in [
                     '/guides/', '/resources/', '/learn/', '/blog/',
                     'interview', 'guide', 'preparation'
                 ]):
@@ -1660,22 +1824,24 @@ class ComprehensiveScraper:
     
     def _is_likely_blog_post_url(self, href: str) -> bool:
         """Check if URL is likely a blog post."""
+        href_lower = href.lower()
+        
         # Skip common non-blog URLs
-        if any(pattern in href.lower() for pattern in [
+        if any(pattern in href_lower for pattern in [
             '/tag/', '/category/', '/archive/', '/page/',
             '/search', '/about', '/contact', '/privacy'
         ]):
             return False
         
         # Look for blog post patterns
-        if any(pattern in href.lower() for pattern in [
+        if any(pattern in href_lower for pattern in [
             '/blog/', '/post/', '/article/', '/news/',
             '/guides/', '/interview'
         ]):
             return True
         
         # Check for date patterns in URL
-        if re.search(r'/\d{4}/', href):
+        if _YEAR_PATH_RE.search(href):
             return True
         
         return False
@@ -1698,10 +1864,7 @@ class ComprehensiveScraper:
         print(f"   Total items: {len(self.all_items)}")
         
         # Group by source domain
-        domain_counts = {}
-        for item in self.all_items:
-            domain = urlparse(item.get('source_url', '')).netloc
-            domain_counts[domain] = domain_counts.get(domain, 0) + 1
+        domain_counts = Counter(urlparse(item.get('source_url', '')).netloc for item in self.all_items)
         
         for domain, count in sorted(domain_counts.items()):
             print(f"   {domain}: {count} items")
@@ -1712,11 +1875,15 @@ class ComprehensiveScraper:
             'system design', 'leadership principles', 'algorithm', 'data structure'
         ]
         
+        # Lowercase each item once rather than once per keyword
+        searchable = [
+            (item.get('title', '').lower(), item.get('content', '').lower())
+            for item in self.all_items
+        ]
+        
         print(f"\n🎯 CONTENT COVERAGE:")
         for keyword in required_keywords:
-            count = sum(1 for item in self.all_items 
-                       if keyword.lower() in item.get('title', '').lower() or 
-                          keyword.lower() in item.get('content', '').lower())
+            count = sum(1 for title, content in searchable if keyword in title or keyword in content)
             print(f"   {keyword}: {count} items")
 
 
@@ -9,22 +9,30 @@ from typing import Dict, Any, Optional
 from bs4 import BeautifulSoup
 
 from config_loader import ScrapingTarget, ScraperConfig
+from generic_scraper import HTML_PARSER, has_byline
+from http_session import create_session
 
 
 class ZenRowsScraper:
     """ZenRows API scraper for handling difficult-to-scrape websites."""
     
-    def __init__(self, config: ScraperConfig, api_key: str):
+    def __init__(self, config: ScraperConfig, api_key: str, session: Optional[requests.Session] = None):
         """
         Initialize ZenRows scraper.
         
         Args:
             config: Main scraper configuration
             api_key: ZenRows API key
+            session: Session for API calls; a pooled one is created if omitted. Don't pass
+                the scraping session, whose browser headers aren't meant for the API and
+                whose status retries would re-bill API credits.
         """
         self.config = config
         self.api_key = api_key
         self.base_url = "https://api.zenrows.com/v1/"
+        # Every call goes to the same API host, so keep its connection alive between calls.
+        # No status retries: each retried call is billed, and 429s carry ZenRows' own limits.
+        self.session = session if session is not None else create_session(status_retries=False)
         
     def scrape_url(self, url: str, target: ScrapingTarget, use_premium: bool = False) -> Optional[Dict[str, Any]]:
         """
@@ -56,7 +64,7 @@ class ZenRowsScraper:
         
         try:
             # Make request to ZenRows API
-            response = requests.get(
+            response = self.session.get(
                 self.base_url, 
                 params=params, 
                 timeout=self.config.timeout * 2  # Give ZenRows more time
@@ -64,7 +72,7 @@ class ZenRowsScraper:
             response.raise_for_status()
             
             # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # Extract content using existing target configuration
             title = self._extract_title(soup, target)
@@ -121,10 +129,10 @@ class ZenRowsScraper:
             })
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=self.config.timeout * 2)
+            response = self.session.get(self.base_url, params=params, timeout=self.config.timeout * 2)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # Find article links using target configuration
             links = soup.select(target.article_link_selector)
@@ -211,11 +219,7 @@ class ZenRowsScraper:
     
     def _should_exclude_content(self, text: str, target: ScrapingTarget) -> bool:
         """Check if content should be excluded based on patterns."""
-        text_lower = text.lower()
-        for pattern in target.exclude_content_patterns:
-            if pattern.lower() in text_lower:
-                return True
-        return False
+        return target.excludes(text)
     
     def _extract_author(self, soup: BeautifulSoup, target: ScrapingTarget) -> str:
         """Extract author information using target configuration."""
@@ -247,8 +251,7 @@ class ZenRowsScraper:
     
     def _extract_author_byline(self, soup: BeautifulSoup) -> str:
         """Extract author from byline text (custom method for interviewing.io)."""
-        import re
-        byline_element = soup.find(text=re.compile(r'By\s+'))
+        byline_element = soup.find(string=has_byline)
         if byline_element:
             byline_text = byline_element.strip()
             if "By " in byline_text and "|" in byline_text:
@@ -272,7 +275,7 @@ class ZenRowsScraper:
                 'apikey': self.api_key,
             }
             
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = self.session.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
             
             # Check response headers for credit information